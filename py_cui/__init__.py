@@ -159,6 +159,10 @@ class PyCUI:
         self._root                  = self.create_new_layout(num_rows, num_cols)
         self._refresh_timeout       = -1
 
+        # The screen is only erased and fully redrawn when this is set,
+        # otherwise only widgets that changed are redrawn.
+        self._full_redraw           = True
+
         # Variables for determining selected widget/focus mode
         self._popup                 = None
         self._auto_focus_buttons    = auto_focus_buttons
@@ -332,7 +336,9 @@ class PyCUI:
             'VERTICAL': vertical,
             'SCROLLBAR': scroll,
         }
-        self._logger.info('Set border_characters to {}'.format(self._border_characters))
+        self._logger.info('Set border_characters to %s', self._border_characters)
+        # Widgets that are not dirty would otherwise keep showing the old borders
+        self._full_redraw = True
 
 
     def get_element_at_position(self, x, y):
@@ -351,12 +357,12 @@ class PyCUI:
         if self._auto_focus_buttons and auto_press_buttons and isinstance(widget, py_cui.widgets.Button):
             if widget.command is not None:
                 widget.command()
-            self._logger.info('Moved focus to button {} - ran autofocus command'.format(widget.get_title()))
+            self._logger.info('Moved focus to button %s - ran autofocus command', widget.get_title())
         elif self._auto_focus_buttons and isinstance(widget, py_cui.widgets.Button):
             self.status_bar.set_text(self._init_status_bar_text)
         else:
             self.status_bar.set_text(widget.get_help_text())
-        self._logger.info('Moved focus to widget {}'.format(widget.get_title()))
+        self._logger.info('Moved focus to widget %s', widget.get_title())
 
 
     def add_key_command(self, key, command):
@@ -381,7 +387,7 @@ class PyCUI:
 
         color       = WHITE_ON_BLACK
         self._popup = py_cui.popups.MessagePopup(self, title, text, color, self._renderer, self._logger)
-        self._logger.info('Opened {} popup with title {}'.format(str(type(self._popup)), self._popup.get_title()))
+        self._logger.info('Opened %s popup with title %s', type(self._popup), self._popup.get_title())
 
 
     def show_warning_popup(self, title, text):
@@ -397,7 +403,7 @@ class PyCUI:
 
         color       = YELLOW_ON_BLACK
         self._popup = py_cui.popups.MessagePopup(self, 'WARNING - ' + title, text, color, self._renderer, self._logger)
-        self._logger.info('Opened {} popup with title {}'.format(str(type(self._popup)), self._popup.get_title()))
+        self._logger.info('Opened %s popup with title %s', type(self._popup), self._popup.get_title())
 
 
     def show_error_popup(self, title, text):
@@ -413,7 +419,7 @@ class PyCUI:
 
         color       = RED_ON_BLACK
         self._popup = py_cui.popups.MessagePopup(self, 'ERROR - ' + title, text, color, self._renderer, self._logger)
-        self._logger.info('Opened {} popup with title {}'.format(str(type(self._popup)), self._popup.get_title()))
+        self._logger.info('Opened %s popup with title %s', type(self._popup), self._popup.get_title())
 
 
     def show_yes_no_popup(self, title, command):
@@ -431,7 +437,7 @@ class PyCUI:
 
         color       = WHITE_ON_BLACK
         self._popup = py_cui.popups.YesNoPopup(self, title + '- (y/n)', 'Yes - (y), No - (n)', color, command, self._renderer, self._logger)
-        self._logger.info('Opened {} popup with title {}'.format(str(type(self._popup)), self._popup.get_title()))
+        self._logger.info('Opened %s popup with title %s', type(self._popup), self._popup.get_title())
 
 
     def show_text_box_popup(self, title, command, password=False):
@@ -451,7 +457,7 @@ class PyCUI:
 
         color       = WHITE_ON_BLACK
         self._popup = py_cui.popups.TextBoxPopup(self, title, color, command, self._renderer, password, self._logger)
-        self._logger.info('Opened {} popup with title {}'.format(str(type(self._popup)), self._popup.get_title()))
+        self._logger.info('Opened %s popup with title %s', type(self._popup), self._popup.get_title())
 
 
     def show_menu_popup(self, title, menu_items, command, run_command_if_none=False):
@@ -473,7 +479,7 @@ class PyCUI:
 
         color       = WHITE_ON_BLACK
         self._popup = py_cui.popups.MenuPopup(self, menu_items, title, color, command, self._renderer, self._logger, run_command_if_none)
-        self._logger.info('Opened {} popup with title {}'.format(str(type(self._popup)), self._popup.get_title()))
+        self._logger.info('Opened %s popup with title %s', type(self._popup), self._popup.get_title())
 
 
     def show_loading_icon_popup(self, title, message, callback=None):
@@ -495,7 +501,7 @@ class PyCUI:
         color         = WHITE_ON_BLACK
         self._loading = True
         self._popup   = py_cui.popups.LoadingIconPopup(self, title, message, color, self._renderer, self._logger)
-        self._logger.info('Opened {} popup with title {}'.format(str(type(self._popup)), self._popup.get_title()))
+        self._logger.info('Opened %s popup with title %s', type(self._popup), self._popup.get_title())
 
 
     def show_loading_bar_popup(self, title, num_items, callback=None):
@@ -519,7 +525,7 @@ class PyCUI:
         color         = WHITE_ON_BLACK
         self._loading = True
         self._popup   = py_cui.popups.LoadingBarPopup(self, title, num_items, color, self._renderer, self._logger)
-        self._logger.info('Opened {} popup with title {}'.format(str(type(self._popup)), self._popup.get_title()))
+        self._logger.info('Opened %s popup with title %s', type(self._popup), self._popup.get_title())
 
 
     def show_form_popup(self, title, fields, passwd_fields=[], required=[], callback=None):
@@ -593,6 +599,7 @@ class PyCUI:
         """Closes the popup, and resets focus
         """
 
+        self._full_redraw = True
         self.lose_focus()
         self._popup = None
 
@@ -630,7 +637,8 @@ class PyCUI:
         stdscr.addstr(2, 0, 'Most likely terminal dimensions are too small.')
         stdscr.attroff(curses.color_pair(RED_ON_BLACK))
         stdscr.refresh()
-        self._logger.info('Encountered error -> {}'.format(error_info))
+        self._full_redraw = True
+        self._logger.info('Encountered error -> %s', error_info)
 
 
     def _handle_key_presses(self, key_pressed):
@@ -683,9 +691,6 @@ class PyCUI:
                 if self._stopped:
                     break
 
-                # Initialization and size adjustment
-                stdscr.erase()
-
                 # If the user defined an update function to fire on each draw call,
                 # Run it here. This can of course be also handled user-side
                 # through a separate thread.
@@ -700,7 +705,8 @@ class PyCUI:
                     else:
                         height = self._simulated_terminal[0]
                         width  = self._simulated_terminal[1]
-                    self._logger.info('Resizing CUI to new dimensions {} by {}'.format(height, width))
+                    self._logger.info('Resizing CUI to new dimensions %s by %s', height, width)
+                    self._full_redraw = True
                     try:
                         self._refresh_height_width(height, width)
                     except py_cui.errors.PyCUIOutOfBoundsError as e:
@@ -727,7 +733,7 @@ class PyCUI:
 
                 # If we have a post_loading_callback, fire it here
                 if self._post_loading_callback is not None and not self._loading:
-                    self._logger.info('Firing post-loading callback function {}'.format(self._post_loading_callback.__name__))
+                    self._logger.info('Firing post-loading callback function %s', self._post_loading_callback.__name__)
                     self._post_loading_callback()
                     self._post_loading_callback = None
 
@@ -741,6 +747,10 @@ class PyCUI:
                 self._handle_key_presses(key_pressed)
 
                 try:
+                    if self._full_redraw:
+                        stdscr.erase()
+                        self._root._mark_all_dirty()
+                        self._full_redraw = False
                     # Draw status/title bar, and all widgets. Selected widget will be bolded.
                     self._draw_status_bars(stdscr, self._height, self._width)
                     self._root._draw()
@@ -769,7 +779,7 @@ class PyCUI:
                     # self._logger.info('Waiting for next keypress')
                     key_pressed = stdscr.getch()
                     if key_pressed > 0:
-                        self._logger.info('keypress {}'.format(key_pressed))
+                        self._logger.info('keypress %s', key_pressed)
 
             except KeyboardInterrupt:
                 self._logger.info('Detect Keyboard Interrupt, Exiting...')
@@ -780,7 +790,7 @@ class PyCUI:
         stdscr.refresh()
         curses.endwin()
         if self._on_stop is not None:
-            self._logger.info('Firing onstop function {}'.format(self._on_stop.__name__))
+            self._logger.info('Firing onstop function %s', self._on_stop.__name__)
             self._on_stop()
 
 
@@ -182,7 +182,7 @@ class ColorRule:
             String representing rule type. ['startswith', 'endswith', 'notstartswith', 'notendswith', 'contains']
         match_type : str
             String representing the match type. ['line', 'regex', 'region']
-        region : [int, int]
+        region : (int, int)
             Start and end positions for the coloring, None if match_type != 'region'
         include_whitespace : bool
             Flag to determine whether to strip whitespace before matching.
@@ -193,17 +193,34 @@ class ColorRule:
         self._focus_color      = focus_color
         self._rule_type        = rule_type
         self._match_type       = match_type
-        self._region           = region
+        # A private copy, since the bounds are put in order and clamped in place
+        self._region           = list(region) if region is not None else None
 
         if self._region is not None:
             if self._region[0] > self._region[1]:
-                temp = region[0]
-                self._region[0] = self._region[1]
-                self._region[1] = temp
+                self._region.reverse()
 
         self._include_whitespace   = include_whitespace
         self._logger               = logger
 
+        # Compiled once here rather than looked up in re's cache for every drawn line.
+        # startswith/endswith rules use the text literally, so it need not be a valid pattern
+        try:
+            self._pattern = re.compile(regex)
+        except re.error:
+            self._pattern = None
+            if rule_type == 'contains' or match_type == 'regex':
+                self._logger.warn('Color rule %r is not a valid regular expression', regex)
+
+
+    def _get_pattern(self):
+        """Returns the compiled rule pattern, raising re.error if it does not compile
+        """
+
+        if self._pattern is None:
+            return re.compile(self._regex)
+        return self._pattern
+
 
     def _check_match(self, line):
         """Checks if the color rule matches a line
@@ -237,7 +254,7 @@ class ColorRule:
                 return False
             return True
         elif self._rule_type == 'contains':
-            if re.search(self._regex, line) is not None:
+            if self._get_pattern().search(line) is not None:
                 return True
         return False
 
@@ -259,7 +276,7 @@ class ColorRule:
         """
 
         fragments = []
-        matches = re.findall(self._regex, render_text)
+        matches = self._get_pattern().findall(render_text)
         current_render_text = render_text
         for match in matches:
             temp = current_render_text.split(match, 1)
@@ -317,6 +334,6 @@ class ColorRule:
             elif self._match_type == 'region':
                 fragments = self._split_text_on_region(widget, render_text, focused)
 
-            self._logger.info('Generated fragments: {}'.format(fragments))
+            self._logger.info('Generated fragments: %s', fragments)
 
         return fragments, match
@@ -120,71 +120,93 @@ class PyCUILogger(logging.Logger):
         return "{}: Function {} in {}:{}".format(text, func.co_name, os.path.basename(func.co_filename), func.co_firstlineno)
     
     
-    def info(self, text):
+    def info(self, text, *args):
         """Adds stacktrace info to log
+
+        Formatting of ``text`` with ``args`` is deferred to the logging module,
+        and skipped entirely if INFO messages are disabled.
         
         Parameters
         ----------
         text : str
             The log text ot display
+        args : objects
+            Optional %-style format arguments for text
         """
 
+        if not self.isEnabledFor(logging.INFO):
+            return
         debug_text = self._get_debug_text(text)
-        super().info(debug_text)
+        super().info(debug_text, *args)
 
 
-    def debug(self, text):
+    def debug(self, text, *args):
         """Function that allows for live debugging of py_cui programs by displaying log messages in the satus bar
         
         Parameters
         ----------
         text : str
             The log text ot display
+        args : objects
+            Optional %-style format arguments for text
         """
 
+        live = self._live_debug_level == logging.DEBUG and self._live_debug_enabled
+        if not live and not self.isEnabledFor(logging.DEBUG):
+            return
         debug_text = self._get_debug_text(text)
-        if self._live_debug_level == logging.DEBUG and self._live_debug_enabled:
+        if live:
             if self.py_cui_root is not None:
-                self.py_cui_root.status_bar.set_text(debug_text)
-                super().debug(debug_text)
+                self.py_cui_root.status_bar.set_text(debug_text % args if args else debug_text)
+                super().debug(debug_text, *args)
         else:
-            super().debug(debug_text)
+            super().debug(debug_text, *args)
 
 
-    def warn(self, text):
+    def warn(self, text, *args):
         """Function that allows for live debugging of py_cui programs by displaying log messages in the satus bar
         
         Parameters
         ----------
         text : str
             The log text ot display
+        args : objects
+            Optional %-style format arguments for text
         """
 
+        live = self._live_debug_level < logging.WARN and self._live_debug_enabled
+        if not live and not self.isEnabledFor(logging.WARN):
+            return
         debug_text = self._get_debug_text(text)
-        if self._live_debug_level < logging.WARN and self._live_debug_enabled:
+        if live:
             if self.py_cui_root is not None:
-                self.py_cui_root.status_bar.set_text(debug_text)
-                super().debug(debug_text)
+                self.py_cui_root.status_bar.set_text(debug_text % args if args else debug_text)
+                super().debug(debug_text, *args)
         else:
-            super().warn(debug_text)
+            super().warn(debug_text, *args)
 
 
-    def error(self, text):
+    def error(self, text, *args):
         """Function that displays error messages live in status bar for py_cui logging
         
         Parameters
         ----------
         text : str
             The log text ot display
+        args : objects
+            Optional %-style format arguments for text
         """
 
+        live = self._live_debug_level < logging.ERROR and self._live_debug_enabled
+        if not live and not self.isEnabledFor(logging.ERROR):
+            return
         debug_text = self._get_debug_text(text)
-        if self._live_debug_level < logging.ERROR and self._live_debug_enabled:
+        if live:
             if self.py_cui_root is not None:
-                self.py_cui_root.status_bar.set_text(debug_text)
-                super().debug(debug_text)
+                self.py_cui_root.status_bar.set_text(debug_text % args if args else debug_text)
+                super().debug(debug_text, *args)
         else:
-            super().error(debug_text)
+            super().error(debug_text, *args)
 
 
     def toggle_live_debug(self, level=logging.ERROR):
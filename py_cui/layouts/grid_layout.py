@@ -13,10 +13,12 @@ class GridLayout(Layout):
     self._offset_y = 0
     self._row_height = 0
     self._col_width = 0
+    self._col_x = []
+    self._row_y = []
 
 
   def _refresh_height_width(self, height, width):
-    self._gui._logger.info("RESIZE {} {}".format(height, width))
+    self._gui._logger.info('RESIZE %s %s', height, width)
     super()._refresh_height_width(height, width)
 
     # minimal cell size is 3x3
@@ -30,34 +32,33 @@ class GridLayout(Layout):
     self._offset_x = (self._width % self._col_width) // 2
     self._offset_y = (self._height % self._row_height) // 2
 
-    for _, (w, (row, col, row_span, col_span)) in self._widgets.items():
-      this_offset_x = self._offset_x
-      this_offset_y = self._offset_y
-      if col == 0 and w._style['snap_border']:
-        this_offset_x = 0
-      if row == 0 and w._style['snap_border']:
-        this_offset_y = 0
-      w._start_x = col * self._col_width + self._gui._left_padding + this_offset_x
-      w._start_y = row * self._row_height + self._gui._top_padding + 1 + this_offset_y
-
-      if col + col_span == self._num_cols and w._style['snap_border']:
-        w._stop_x = self._width + self._gui._left_padding - 1
-      else:
-        w._stop_x = col * self._col_width + self._offset_x + self._gui._left_padding + self._col_width * col_span - 1
-
-      if row + row_span == self._num_rows and w._style['snap_border']:
-        w._stop_y = self._height + self._gui._top_padding
-      else:
-        w._stop_y = row * self._row_height + self._offset_y + self._gui._top_padding + self._row_height * row_span
+    # Grid line positions, shared by every widget placed on the grid
+    origin_x = self._offset_x + self._gui._left_padding
+    origin_y = self._offset_y + self._gui._top_padding
+    col_width, row_height = self._col_width, self._row_height
+    self._col_x = [c * col_width + origin_x for c in range(self._num_cols + 1)]
+    self._row_y = [r * row_height + origin_y for r in range(self._num_rows + 1)]
+    snapped_start_x = self._gui._left_padding
+    snapped_start_y = self._gui._top_padding + 1
+    snapped_stop_x = self._width + snapped_start_x - 1
+    snapped_stop_y = self._height + self._gui._top_padding
+
+    for w in self._widget_list:
+      row, col, row_span, col_span = w._row, w._column, w._row_span, w._column_span
+      snap = w._style['snap_border']
+      w._start_x = snapped_start_x if col == 0 and snap else self._col_x[col]
+      w._start_y = snapped_start_y if row == 0 and snap else self._row_y[row] + 1
+      w._stop_x = snapped_stop_x if col + col_span == self._num_cols and snap else self._col_x[col + col_span] - 1
+      w._stop_y = snapped_stop_y if row + row_span == self._num_rows and snap else self._row_y[row + row_span]
       w.update_size()
+    self._update_hit_order()
 
 
-  def _is_row_col_inside(self, id, r, c):
-    w, (row, col, row_span, col_span) = self._widgets[id]
-    self._gui._logger.info('{} {} <= {} < {} {} <= {} < {} {}'.format(id, row, r, row+row_span, col, c, col+ col_span,
-      row <= r and r < row + row_span and col <= c and c < col + col_span
-      ))
-    return row <= r and r < row + row_span and col <= c and c < col + col_span
+  def _is_row_col_inside(self, w, r, c):
+    row, col, row_span, col_span = w._row, w._column, w._row_span, w._column_span
+    inside = row <= r < row + row_span and col <= c < col + col_span
+    self._gui._logger.info('%s %s <= %s < %s %s <= %s < %s %s', w._id, row, r, row + row_span, col, c, col + col_span, inside)
+    return inside
 
 
   def _get_vertical_neighbor(self, row, col, row_span, col_span, direction):
@@ -65,9 +66,9 @@ class GridLayout(Layout):
 
     for r in range(start, end, step):
       for c in range(col, col + col_span):
-        for id in self._widgets.keys():
-          if self._is_row_col_inside(id, r, c):
-            return id
+        for w in self._widget_list:
+          if self._is_row_col_inside(w, r, c):
+            return w._id
     return None
 
 
@@ -76,14 +77,15 @@ class GridLayout(Layout):
 
     for c in range(start, end, step):
       for r in range(row, row + row_span):
-        for id in self._widgets.keys():
-          if self._is_row_col_inside(id, r, c):
-            return id
+        for w in self._widget_list:
+          if self._is_row_col_inside(w, r, c):
+            return w._id
     return None
 
 
   def _get_neighbor(self, direction):
-    w, (row, col, row_span, col_span) = self._widgets[self._selected_widget]
+    w = self._selected_widget_obj
+    row, col, row_span, col_span = w._row, w._column, w._row_span, w._column_span
 
     if direction in [py_cui.keys.KEY_DOWN_ARROW, py_cui.keys.KEY_UP_ARROW]:
       return self._get_vertical_neighbor(row, col, row_span, col_span, direction)
@@ -97,20 +99,22 @@ class GridLayout(Layout):
           self._gui.status_bar.set_text(self._gui._init_status_bar_text)
           self.lose_focus()
         else:
-          self._widgets[self._selected_widget][0]._handle_key_press(key_pressed)
+          self._selected_widget_obj._handle_key_press(key_pressed)
       else:
         if key_pressed in py_cui.keys.ARROW_KEYS:
           neighbor = self._get_neighbor(key_pressed)
           if neighbor is not None:
             self.set_hover(neighbor)
-        elif key_pressed == py_cui.keys.KEY_ENTER and self._widgets[self._selected_widget][0]._style['selectable']:
+        elif key_pressed == py_cui.keys.KEY_ENTER and self._selected_widget_obj._style['selectable']:
           self.set_focus(self._selected_widget)
         else:
-          self._widgets[self._selected_widget][0]._handle_key_press(key_pressed)
+          self._selected_widget_obj._handle_key_press(key_pressed)
 
 
   def add_widget(self, widget, row, col, row_span=1, col_span=1):
-      self._widgets[widget._id] = (widget, (row, col, row_span, col_span))
+      widget._row, widget._column = row, col
+      widget._row_span, widget._column_span = row_span, col_span
+      self._add_widget(widget)
       if self._selected_widget is None and widget._style['selectable']:
         self.set_hover(widget._id)
       return widget
@@ -1,3 +1,4 @@
+import bisect
 import shutil
 import py_cui.widgets as widgets
 import py_cui.keys
@@ -8,11 +9,23 @@ class Layout:
     self._gui = gui
     self._logger = gui._logger  # for widget to call
     self._renderer = gui._renderer  # for widget to call
-    self._widgets = {}
+    # Widgets are kept in insertion order in a list for fast iteration,
+    # with an id -> widget map for direct lookups.
+    self._widget_list = []
+    self._widget_by_id = {}
+    # Widgets sorted by start x, used to narrow down mouse hit-tests
+    self._hit_order = []
+    self._hit_start_x = []
+    # Draw order, with the selected widget always kept last, and the
+    # position of each widget id within it
+    self._draw_order = []
+    self._draw_pos = {}
+    self._next_id = 0
     self._keybindings = {}
     self._height = height
     self._width = width
     self._selected_widget = None
+    self._selected_widget_obj = None
     self._in_focused_mode = False  # if in_focused_mode the widget handles key press
 
 
@@ -22,40 +35,65 @@ class Layout:
 
 
   def _cycle_widgets(self, reverse=False):
-    ids = list(self._widgets.keys())
-    pos = ids.index(self._selected_widget)
+    pos = self._widget_list.index(self._selected_widget_obj)
     pos += 1 if not reverse else -1
-    if pos >= len(ids): pos = 0
-    self.set_hover(ids[pos])
+    if pos >= len(self._widget_list): pos = 0
+    self.set_hover(self._widget_list[pos]._id)
 
 
   def _draw(self):
-    for id, (w, _) in self._widgets.items():
-      if id != self._selected_widget:
+    # Only widgets whose appearance changed are redrawn, the rest of the screen is kept.
+    for w in self._draw_order:
+      if w._dirty:
         w._draw()
-    # We draw the selected widget last to support cursor location.
-    if self._selected_widget is not None:
-        self._widgets[self._selected_widget][0]._draw()
+    # The selected widget is last in the draw order, and always places the cursor.
+    if self._draw_order:
+      self._draw_order[-1]._update_cursor()
+
+
+  def _mark_all_dirty(self):
+    for w in self._widget_list:
+      w._dirty = True
+
+
+  def _move_to_draw_end(self, id):
+    # Swap with the current last widget, order among the others does not matter
+    pos = self._draw_pos[id]
+    last = len(self._draw_order) - 1
+    if pos == last:
+      return
+    other = self._draw_order[last]
+    self._draw_order[pos], self._draw_order[last] = other, self._draw_order[pos]
+    self._draw_pos[other._id] = pos
+    self._draw_pos[id] = last
 
 
   def lose_focus(self):
     self._in_focused_mode = False
-    self._widgets[self._selected_widget][0].set_focused(False)
-    self._widgets[self._selected_widget][0].set_hovering(True)
+    self._selected_widget_obj._focused = False
+    self._selected_widget_obj._hovering = True
+    self._selected_widget_obj._dirty = True
 
 
   def set_focus(self, id):
     self.lose_focus()
     self._selected_widget = id
-    self._widgets[self._selected_widget][0].set_focused(True)
+    self._selected_widget_obj = self._widget_by_id[id]
+    self._move_to_draw_end(id)
+    self._selected_widget_obj._focused = True
+    self._selected_widget_obj._dirty = True
     self._in_focused_mode = True
 
 
   def set_hover(self, id):
-    if self._selected_widget is not None:
-      self._widgets[self._selected_widget][0].set_hovering(False)
+    if self._selected_widget_obj is not None:
+      self._selected_widget_obj._hovering = False
+      self._selected_widget_obj._dirty = True
     self._selected_widget = id
-    self._widgets[self._selected_widget][0].set_hovering(True)
+    self._selected_widget_obj = self._widget_by_id[id]
+    self._move_to_draw_end(id)
+    self._selected_widget_obj._hovering = True
+    self._selected_widget_obj._dirty = True
 
 
   def add_key_command(self, key, command):
@@ -63,11 +101,32 @@ class Layout:
 
 
   def get_next_id(self):
-      return len(self._widgets.keys())
+      # Monotonic counter so ids stay unique even if widgets are removed
+      self._next_id += 1
+      return self._next_id - 1
+
+
+  def _add_widget(self, widget):
+    self._widget_list.append(widget)
+    self._widget_by_id[widget._id] = widget
+    self._draw_pos[widget._id] = len(self._draw_order)
+    self._draw_order.append(widget)
+    if self._selected_widget is not None:
+      self._move_to_draw_end(self._selected_widget)
+    self._update_hit_order()
+
+
+  def _update_hit_order(self):
+    # Must be called whenever widget positions change
+    self._hit_order = sorted(self._widget_list, key=lambda w: w._start_x)
+    self._hit_start_x = [w._start_x for w in self._hit_order]
 
 
   def get_element_at_position(self, x, y):
-    for id, (w, _) in self._widgets.items():
+    # Only widgets starting at or left of x can contain the position
+    candidates = bisect.bisect_right(self._hit_start_x, x)
+    for i in range(candidates):
+      w = self._hit_order[i]
       if w._contains_position(x, y):
         return w
 
@@ -7,6 +7,7 @@
 
 # required library imports
 import curses
+import itertools
 import py_cui
 import py_cui.ui
 import py_cui.errors
@@ -369,19 +370,15 @@ class MenuPopup(Popup, MenuImplementation):
         self._renderer.draw_border(self)
         self._renderer.set_color_rules([])
         counter = self._pady + 1
-        line_counter = 0
-        for line in self._view_items:
-            if line_counter < self._top_view:
-                line_counter = line_counter + 1
+        # Start directly at the top of the view instead of skipping earlier items
+        for line_counter, line in enumerate(itertools.islice(self._view_items, self._top_view, None), self._top_view):
+            if counter >= self._height - self._pady - 1:
+                break
+            if line_counter == self.get_selected_item_index():
+                self._renderer.draw_text(self, line, self._start_y + counter, selected=True)
             else:
-                if counter >= self._height - self._pady - 1:
-                    break
-                if line_counter == self.get_selected_item_index():
-                    self._renderer.draw_text(self, line, self._start_y + counter, selected=True)
-                else:
-                    self._renderer.draw_text(self, line, self._start_y + counter)
-                counter = counter + 1
-                line_counter = line_counter + 1
+                self._renderer.draw_text(self, line, self._start_y + counter)
+            counter = counter + 1
         self._renderer.unset_color_mode(self._color)
         self._renderer.reset_cursor(self)
 
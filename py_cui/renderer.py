@@ -69,7 +69,7 @@ class Renderer:
         _, start_y    = ui_element.get_viewport_start_pos()
         stop_x, _     = ui_element.get_widget_stop_pos()
         height        = ui_element.get_viewport_height()
-        # self._gui._logger.info('scroll {} {} {}'.format(begin, end, limit))
+        # self._gui._logger.info('scroll %s %s %s', begin, end, limit)
         if begin == 1 and end >= limit:
             return
         begin_ratio = float(begin - 1) / limit
@@ -88,6 +88,42 @@ class Renderer:
         self.unset_color_mode(ui_element.get_border_color())
 
 
+    def draw_element(self, ui_element, clear=False):
+        """Draws a whole ui element: background, border, content and scrollbar
+
+        The element color is switched on once around the whole block, and the
+        element's own hooks are called for the border, content and scrollbar.
+
+        Parameters
+        ----------
+        ui_element : py_cui.ui.UIElement
+            The element to draw
+        clear : bool
+            If True, blank the element's cell before drawing
+        """
+
+        stdscr = self._gui._stdscr
+        if clear:
+            self.clear_element(ui_element)
+        color = curses.color_pair(ui_element._style['color'])
+        stdscr.attron(color)
+        if ui_element._style['show_border']:
+            ui_element._draw_border()
+        ui_element._draw_content()
+        # The scrollbar goes last, since drawing the content counts the displayed lines
+        ui_element._draw_scrollbar()
+        stdscr.attroff(color)
+
+
+    def clear_element(self, ui_element):
+        start_x, start_y = ui_element.get_start_position()
+        stop_x, stop_y = ui_element.get_stop_position()
+        blank = ' ' * (stop_x - start_x + 1)
+        addstr = self._gui._stdscr.addstr
+        for y in range(start_y, stop_y + 1):
+            addstr(y, start_x, blank)
+
+
     def draw_border(self, ui_element):
         if ui_element.is_hovering():
             self._set_bold()
@@ -97,8 +133,9 @@ class Renderer:
 
         self._draw_border_top(ui_element, border_y_start)
 
+        draw_blank_row = self._draw_blank_row
         for i in range(border_y_start + 1, border_y_stop):
-            self._draw_blank_row(ui_element, i)
+            draw_blank_row(ui_element, i)
 
         self._draw_border_bottom(ui_element, border_y_stop)
 
@@ -195,33 +232,44 @@ class Renderer:
 
 
     def draw_text_in_viewport(self, ui_element, multi_lines, selected=False, start_pos=0):
+      # multi_lines may be a string, or a list of lines already split by the caller
+      lines = multi_lines.splitlines() if isinstance(multi_lines, str) else multi_lines
       start_x, start_y = ui_element.get_viewport_start_pos()
       stop_x, stop_y = ui_element.get_viewport_stop_pos()
       if ui_element._style['vertical_alignment'] == 'top':
-        return self.draw_text_in(ui_element, multi_lines, start_x, stop_x, start_y, stop_y, selected, start_pos)
+        return self.draw_text_in(ui_element, lines, start_x, stop_x, start_y, stop_y, selected, start_pos)
 
-      count = len(multi_lines.splitlines())
+      count = len(lines)
       height = ui_element.get_viewport_height()
       if ui_element._style['vertical_alignment'] == 'middle':
-        return self.draw_text_in(ui_element, multi_lines, start_x, stop_x,
+        return self.draw_text_in(ui_element, lines, start_x, stop_x,
             start_y + (height - count) // 2, stop_y, selected, start_pos)
       elif ui_element._style['vertical_alignment'] == 'bottom':
         if count > height: count = height
-        return self.draw_text_in(ui_element, multi_lines, start_x, stop_x,
+        return self.draw_text_in(ui_element, lines, start_x, stop_x,
             stop_y - count + 1, stop_y, selected, start_pos)
 
 
     def draw_text_in(self, ui_element, multi_lines, start_x, stop_x, start_y, stop_y, selected=False, start_pos=0):
-      lines = multi_lines.splitlines()
+      lines = multi_lines.splitlines() if isinstance(multi_lines, str) else multi_lines
+      draw_one_line_text_in = self._draw_one_line_text_in
       y = start_y
       i = 0
       while y <= stop_y and i < len(lines):
-        self._draw_one_line_text_in(ui_element, lines[i], start_x, stop_x, y, selected, start_pos)
+        draw_one_line_text_in(ui_element, lines[i], start_x, stop_x, y, selected, start_pos)
         y += 1
         i += 1
       return i
 
 
+    def draw_text_batch(self, ui_element, rows, start_x, stop_x, start_pos=0):
+      # rows is a list of (y, line, selected) tuples, one per screen row
+      draw_one_line_text_in = self._draw_one_line_text_in
+      for y, line, selected in rows:
+        draw_one_line_text_in(ui_element, line, start_x, stop_x, y, selected, start_pos)
+      return len(rows)
+
+
     def _get_render_text_in(self, ui_element, line, space, selected, start_pos):
         render_text_length = space
         if len(line) - start_pos < render_text_length:
@@ -238,6 +286,7 @@ class Renderer:
         space = stop_x - start_x + 1
         render_text = self._get_render_text_in(ui_element, line, space, selected, start_pos)
         current_start_x = start_x
+        addstr = self._gui._stdscr.addstr
 
         # Each text elem is a list with [text, color]
         for text_elem in render_text:
@@ -247,7 +296,7 @@ class Renderer:
             if selected and text_elem[1] != py_cui.BLACK_ON_WHITE:
                 self._set_bold()
 
-            self._gui._stdscr.addstr(y, current_start_x, text_elem[0])
+            addstr(y, current_start_x, text_elem[0])
             current_start_x += len(text_elem[0])
 
             if selected and text_elem[1] != py_cui.BLACK_ON_WHITE:
@@ -275,6 +324,8 @@ class Renderer:
         render_text = self._get_render_text(ui_element, line, centered, selected, start_pos)
         current_start_x = start_x
 
+        # Keep the border pair even when the border color matches the element color the caller set:
+        # attroff clears the bits regardless, so the text after it is drawn without the outer color
         if bordered:
             if ui_element.is_hovering(): self._set_bold()
             self.set_color_mode(ui_element.get_border_color())
@@ -1,52 +1,73 @@
+import types
 import py_cui
 import py_cui.errors
 import py_cui.colors
 
 
 class UIElement:
+    # Default attributes, shared read-only by every element.
+    _DEFAULT_STYLE = types.MappingProxyType({
+        'color': py_cui.colors.WHITE_ON_BLACK,
+        'border_color': py_cui.colors.WHITE_ON_BLACK,
+        'hover_border_color': py_cui.colors.WHITE_ON_BLACK,
+        'focus_border_color': py_cui.colors.BLACK_ON_WHITE,
+        'selected_color': py_cui.colors.WHITE_ON_BLACK,
+        'margin_x': 0,
+        'margin_y': 0,
+        'padding_x': 1,
+        'padding_y': 0,
+        'border_width': 1,
+        'snap_border': True,
+        'alignment': 'left',
+        'vertical_alignment': 'top',
+        'selectable': True,
+        'show_border': True,
+        'show_title': True,
+        'show_footer': True,
+        'single_line_mode': False,
+    })
+
+
     def __init__(self, id, title, renderer, logger):
         self._id = id
-        self._start_x, self._stop_y = 0, 0
-        self._stop_x, self._start_y = 0, 0
+        self._start_x = 0
+        self._start_y = 0
+        self._stop_x = 0
+        self._stop_y = 0
 
         self._title = title
         self._footer = ''
         self._help_text = ''
 
-        self._height, self._width = 0, 0
+        self._height = 0
+        self._width = 0
+        # Row offset of the middle line in single line mode, updated on resize
+        self._half_height = 0
+        # Cached widget and viewport corners and viewport size, rebuilt after a resize or style change
+        self._geometry = None
         # Default UI Element color is white on black.
         self._mouse_press_handler = None
         self._hovering = False
         self._focused = False
+        # Set whenever the element's appearance may have changed, cleared when drawn
+        self._dirty = True
+        # Set when a style change may move the border or viewport
+        self._clear_on_draw = False
         self._renderer = renderer
         self._logger = logger
 
-        # default attributes
-        self._style = {
-            'color': py_cui.WHITE_ON_BLACK,
-            'border_color': py_cui.WHITE_ON_BLACK,
-            'hover_border_color': py_cui.WHITE_ON_BLACK,
-            'focus_border_color': py_cui.BLACK_ON_WHITE,
-            'selected_color': py_cui.WHITE_ON_BLACK,
-            'margin_x': 0,
-            'margin_y': 0,
-            'padding_x': 1,
-            'padding_y': 0,
-            'border_width': 1,
-            'snap_border': True,
-            'alignment': 'left',
-            'vertical_alignment': 'top',
-            'selectable': True,
-            'show_border': True,
-            'show_title': True,
-            'show_footer': True,
-            'single_line_mode': False,
-        }
+        # Style is shared with _DEFAULT_STYLE until first modified
+        self._style = UIElement._DEFAULT_STYLE
 
 
     def set_style(self, key, value):
       # easy setting style
+      if self._style is UIElement._DEFAULT_STYLE:
+        self._style = dict(UIElement._DEFAULT_STYLE)
       self._style[key] = value
+      self._geometry = None
+      self._dirty = True
+      self._clear_on_draw = True
       return self
 
 
@@ -62,47 +83,74 @@ class UIElement:
         return (self._stop_y - self._start_y + 1), (self._stop_x - self._start_x + 1)
 
 
+    def _compute_geometry(self):
+        viewport_start = self._compute_viewport_start_pos()
+        viewport_stop = self._compute_viewport_stop_pos()
+        self._geometry = (self._compute_widget_start_pos(), self._compute_widget_stop_pos(),
+                          viewport_start, viewport_stop,
+                          viewport_stop[0] - viewport_start[0] + 1,
+                          viewport_stop[1] - viewport_start[1] + 1)
+        return self._geometry
+
+
     def get_widget_start_pos(self):
+        return (self._geometry or self._compute_geometry())[0]
+
+
+    def get_widget_stop_pos(self):
+        return (self._geometry or self._compute_geometry())[1]
+
+
+    def get_viewport_start_pos(self):
+        return (self._geometry or self._compute_geometry())[2]
+
+
+    def get_viewport_stop_pos(self):
+        return (self._geometry or self._compute_geometry())[3]
+
+
+    def _compute_widget_start_pos(self):
         return (self._start_x + self._style['margin_x'],
-                self._start_y + int(self._height / 2) - 1
+                self._start_y + self._half_height - 1
                     if self._style['single_line_mode']
                     else self._start_y + self._style['margin_y'])
 
 
-    def get_widget_stop_pos(self):
+    def _compute_widget_stop_pos(self):
         return (self._stop_x - self._style['margin_x'],
-                self._start_y + int(self._height / 2) + 1
+                self._start_y + self._half_height + 1
                     if self._style['single_line_mode']
                     else self._stop_y - self._style['margin_y'])
 
 
-    def get_viewport_start_pos(self):
-        x, y = self.get_widget_start_pos()
-        return (x + (self._style['border_width'] if self._style['show_border'] else 0) + self._style['padding_x'],
-                y + (self._style['border_width'] if self._style['show_border'] else 0) + self._style['padding_y'])
+    def _compute_viewport_start_pos(self):
+        x, y = self._compute_widget_start_pos()
+        style = self._style
+        border = style['border_width'] if style['show_border'] else 0
+        return (x + border + style['padding_x'], y + border + style['padding_y'])
 
 
-    def get_viewport_stop_pos(self):
-        x, y = self.get_widget_stop_pos()
-        return (x - (self._style['border_width'] if self._style['show_border'] else 0) - self._style['padding_x'],
-                y - (self._style['border_width'] if self._style['show_border'] else 0) - self._style['padding_y'])
+    def _compute_viewport_stop_pos(self):
+        x, y = self._compute_widget_stop_pos()
+        style = self._style
+        border = style['border_width'] if style['show_border'] else 0
+        return (x - border - style['padding_x'], y - border - style['padding_y'])
 
 
     def update_size(self):
         self._height = self._stop_y - self._start_y + 1
+        self._half_height = int(self._height / 2)
+        self._geometry = None
         self._width = self._stop_x - self._start_x + 1
+        self._dirty = True
 
 
     def get_viewport_width(self):
-      startx, _ = self.get_viewport_start_pos()
-      stopx, _ = self.get_viewport_stop_pos()
-      return stopx - startx + 1
+      return (self._geometry or self._compute_geometry())[4]
 
 
     def get_viewport_height(self):
-      _, starty = self.get_viewport_start_pos()
-      _, stopy = self.get_viewport_stop_pos()
-      return stopy - starty + 1
+      return (self._geometry or self._compute_geometry())[5]
 
 
     def get_id(self):
@@ -160,44 +208,50 @@ class UIElement:
 
     def set_title(self, title):
         self._title = title
+        self._dirty = True
 
 
     def set_footer(self, footer):
+        if footer == self._footer:
+            return
         self._footer = footer
+        self._dirty = True
 
 
     def set_color(self, color):
         if self._style['border_color'] == self._style['color']:
-            self._style['border_color'] = color
+            self.set_style('border_color', color)
         if self._style['focus_border_color'] == self._style['color']:
-            self._style['focus_border_color'] = color
+            self.set_style('focus_border_color', color)
         if self._style['hover_border_color'] == self._style['color']:
-            self._style['hover_border_color'] = color
-        self._style['color'] = color
+            self.set_style('hover_border_color', color)
+        self.set_style('color', color)
 
 
     def set_border_color(self, color):
-        self._style['border_color'] = color
+        self.set_style('border_color', color)
 
 
     def set_focus_border_color(self, color):
-        self._style['focus_border_color'] = color
+        self.set_style('focus_border_color', color)
 
 
     def set_hovering_border_color(self, color):
-        self._style['hovering_border_color'] = color
+        self.set_style('hovering_border_color', color)
 
 
     def set_selected_color(self, color):
-        self._style['selected_color'] = color
+        self.set_style('selected_color', color)
 
 
     def set_hovering(self, hovering):
         self._hovering = hovering
+        self._dirty = True
 
 
     def set_focused(self, focused):
         self._focused = focused
+        self._dirty = True
 
 
     def set_help_text(self, help_text):
@@ -236,6 +290,7 @@ class UIElement:
             Coordinates of the mouse press event.
         """
 
+        self._dirty = True
         if self._mouse_press_handler is not None:
             self._mouse_press_handler(x, y)
 
@@ -261,14 +316,22 @@ class UIElement:
         raise NotImplementedError
 
 
+    def _covers_cell(self):
+        # True if drawing the border repaints every character of the element's cell
+        return (self._style['show_border'] and
+                self.get_widget_start_pos() == (self._start_x, self._start_y) and
+                self.get_widget_stop_pos() == (self._stop_x, self._stop_y))
+
+
     def _draw(self):
-        self._renderer.set_color_mode(self._style['color'])
-        if self._style['show_border']:
-          self._draw_border()
-        self._draw_content()
-        # _draw_scrollbar should be after _draw_content, since _draw_content need to count the displaying lines.
-        self._draw_scrollbar()
-        self._renderer.unset_color_mode(self._style['color'])
+        # The screen is not erased between frames, so blank anything we won't repaint
+        self._renderer.draw_element(self, self._clear_on_draw or not self._covers_cell())
+        self._clear_on_draw = False
+        self._dirty = False
+        self._update_cursor()
+
+
+    def _update_cursor(self):
         if self.is_focused():
           self._draw_cursor()
         else:
@@ -277,7 +340,7 @@ class UIElement:
 
 
     def _contains_position(self, x, y):
-        return self._start_x <= x and self._stop_x >= x and self._start_y <= y and self._stop_y >= y
+        return self._start_x <= x <= self._stop_x and self._start_y <= y <= self._stop_y
 
 
 class UIImplementation:
@@ -18,9 +18,9 @@ class Button(Widget):
         """
 
         super().__init__(parent, title)
-        self._style['alignment'] = 'center'
-        self._style['vertical_alignment'] = 'middle'
-        self._style['show_title'] = False
+        self.set_style('alignment', 'center')
+        self.set_style('vertical_alignment', 'middle')
+        self.set_style('show_title', False)
         self.command = command
         self._parent = parent
         self.set_color(py_cui.MAGENTA_ON_BLACK)
@@ -3,44 +3,136 @@ from .scroll_menu import MenuImplementation
 import py_cui.keys
 
 
+def _render_checkbox_rows(items, item_strs, checked, prefixes, top, selected, start_y, stop_y):
+    """Builds the (y, line, selected) rows for the visible part of a checkbox menu
+
+    Parameters
+    ----------
+    items : list of object
+        All menu items
+    item_strs : dict of object -> str
+        Cached string form of each item
+    checked : set of object
+        Items that are currently checked
+    prefixes : tuple of str
+        The (unchecked, checked) row prefixes
+    top : int
+        Index of the first item in view
+    selected : int
+        Index of the highlighted item
+    start_y, stop_y : int
+        First and last screen row of the viewport
+
+    Returns
+    -------
+    rows : list of tuple
+        One (y, line, selected) entry per screen row to draw
+    """
+
+    visible = items[top:top + stop_y - start_y + 1]
+    lines = [prefixes[item in checked] + item_strs[item] for item in visible]
+    # Common case: no item spans several lines, so there is exactly one row per item
+    if all(len(line.splitlines()) == 1 for line in lines):
+        return list(zip(range(start_y, start_y + len(lines)), lines,
+                        [i == selected for i in range(top, top + len(lines))]))
+
+    rows = []
+    append = rows.append
+    y = start_y
+    i = top
+    for item in visible:
+        is_selected = i == selected
+        for line in (prefixes[item in checked] + item_strs[item]).splitlines():
+            if y > stop_y:
+                return rows
+            append((y, line, is_selected))
+            y += 1
+        if y > stop_y:
+            break
+        i += 1
+    return rows
+
+
 class CheckBoxMenuImplementation(MenuImplementation):
     """Class representing checkbox menu ui implementation
 
     Attributes
     ----------
-    _selected_item_dict : dict of object -> bool
-        stores each object and maps to its current selected status
+    _checked : set of object
+        the items that are currently checked
+    _item_strs : dict of object -> str
+        string form of each item, computed once when the item is added
     _checked_char : char
         Character to mark checked items
     """
 
     def __init__(self, logger, checked_char):
         super().__init__(logger)
-        self._selected_item_dict = {}
+        self._checked = set()
+        self._item_strs = {}
         self._checked_char = checked_char
+        # Row prefixes are fixed, so build them once instead of formatting per draw.
+        # Indexed by the item's checked status: (unchecked, checked)
+        self._checked_prefix = '[' + checked_char + '] - '
+        self._unchecked_prefix = '[ ] - '
+        self._row_prefixes = (self._unchecked_prefix, self._checked_prefix)
 
 
     def add_item(self, item):
+        self._item_strs[item] = str(item)
         super().add_item(item)
-        self._selected_item_dict[item] = False
+
+
+    def add_item_list(self, item_list):
+        item_list = list(item_list)
+        self._item_strs.update((item, str(item)) for item in item_list)
+        super().add_item_list(item_list)
 
 
     def remove_selected_item(self):
-        del self._selected_item_dict[self.get()]
+        item = self.get()
+        self._checked.discard(item)
+        del self._item_strs[item]
         super().remove_selected_item()
 
 
     def remove_item(self, item):
-        del self._selected_item_dict[item]
+        self._checked.discard(item)
+        del self._item_strs[item]
         super().remove_item(item)
 
 
+    def set_selected_item(self, selected_item):
+        old_item = self.get()
+        super().set_selected_item(selected_item)
+        if selected_item is None or old_item is None:
+            return
+        self._item_strs[selected_item] = str(selected_item)
+        # The replaced item's string and checked state leave with it, unless it is still listed
+        if old_item not in self._view_items:
+            self._checked.discard(old_item)
+            del self._item_strs[old_item]
+
+
+    def clear(self):
+        super().clear()
+        self._checked.clear()
+        self._item_strs.clear()
+
+
     def mark_item_as_checked(self, item):
-        self._selected_item_dict[item] = not self._selected_item_dict[item]
+        # Toggles the item, an empty menu has no item to toggle
+        if item is None:
+            return
+        if item in self._checked:
+            self._checked.discard(item)
+        else:
+            self._checked.add(item)
+        self._dirty = True
 
 
     def is_checked(self, item):
-          return self._selected_item_dict[item]
+        return item in self._checked
 
 
 class CheckBoxMenu(Widget, CheckBoxMenuImplementation):
@@ -54,41 +146,41 @@ class CheckBoxMenu(Widget, CheckBoxMenuImplementation):
         Character to represent a checked item
     """
 
+    # Maps navigation keys to the name of the method that handles them
+    _KEY_HANDLERS = {
+        py_cui.keys.KEY_UP_ARROW:   '_scroll_up',
+        py_cui.keys.KEY_DOWN_ARROW: '_scroll_down',
+        py_cui.keys.KEY_HOME:       '_jump_to_top',
+        py_cui.keys.KEY_END:        '_jump_to_view_bottom',
+        py_cui.keys.KEY_PAGE_UP:    '_scroll_up',
+        py_cui.keys.KEY_PAGE_DOWN:  '_scroll_down',
+    }
+
     def __init__(self, parent, title, checked_char='*'):
         Widget.__init__(self, parent, title)
         CheckBoxMenuImplementation.__init__(self, parent._logger, checked_char)
         self._parent = parent
         self.set_help_text('Focus mode on CheckBoxMenu. Use up/down to scroll, Enter to toggle set, unset, Esc to exit.')
 
-        self._events['on_change'] = lambda : 0
+        self._events = {'on_change': lambda : 0}
 
 
     def _handle_mouse_press(self, x, y):
         super()._handle_mouse_press(x, y)
         _, viewport_top = self.get_viewport_start_pos()
-        if viewport_top <= y and viewport_top + len(self._view_items) - self._top_view >= y:
-            elem_clicked = y - viewport_top + self._top_view
-            if elem_clicked < len(self._view_items):
-              self.set_selected_item_index(elem_clicked)
-              self.mark_item_as_checked(self._view_items[elem_clicked])
-              self._events['on_change']()
+        elem_clicked = self._get_item_index_at(y, viewport_top)
+        if elem_clicked is not None:
+            self.set_selected_item_index(elem_clicked)
+            self.mark_item_as_checked(self._view_items[elem_clicked])
+            self._events['on_change']()
 
 
     def _handle_key_press(self, key_pressed):
       Widget._handle_key_press(self, key_pressed)
-      if key_pressed == py_cui.keys.KEY_UP_ARROW:
-          self._scroll_up()
-      if key_pressed == py_cui.keys.KEY_DOWN_ARROW:
-          self._scroll_down()
-      if key_pressed == py_cui.keys.KEY_HOME:
-          self._jump_to_top()
-      if key_pressed == py_cui.keys.KEY_END:
-          self._jump_to_bottom()
-      if key_pressed == py_cui.keys.KEY_PAGE_UP:
-          self._scroll_up()
-      if key_pressed == py_cui.keys.KEY_PAGE_DOWN:
-          self._scroll_down()
-      if key_pressed == py_cui.keys.KEY_ENTER:
+      handler = self._KEY_HANDLERS.get(key_pressed)
+      if handler is not None:
+          getattr(self, handler)()
+      elif key_pressed == py_cui.keys.KEY_ENTER:
           self.mark_item_as_checked(self.get())
           self._events['on_change']()
 
@@ -96,12 +188,10 @@ class CheckBoxMenu(Widget, CheckBoxMenuImplementation):
     def _draw_content(self):
       startx, posy = self.get_viewport_start_pos()
       stopx, stopy = self.get_viewport_stop_pos()
-      i = self._top_view
-      while i < len(self._view_items) and posy <= stopy:
-        item = self._view_items[i]
-        line = '[{}] - {}'.format(self._checked_char if self._selected_item_dict[item] else ' ', str(item))
-        posy += self._parent._renderer.draw_text_in(self, line, startx, stopx, posy, stopy, selected=i == self._selected_item)
-        i += 1
+      # Build every visible row first, then hand them to the renderer in one call
+      rows = _render_checkbox_rows(self._view_items, self._item_strs, self._checked,
+                                   self._row_prefixes, self._top_view, self._selected_item, posy, stopy)
+      self._parent._renderer.draw_text_batch(self, rows, startx, stopx)
 
 
 
@@ -6,8 +6,6 @@ class Label(Widget):
 
     Attributes
     ----------
-    lines : list of str
-        list of lines that make up block text
     center : bool
         Decides whether or not label should be centered
     """
@@ -15,15 +13,33 @@ class Label(Widget):
     def __init__(self, parent, title):
       super().__init__(parent, title)
       self._parent = parent
-      self._style['show_border']  = False
-      self._style['selectable'] = False
+      self.set_style('show_border', False)
+      self.set_style('selectable', False)
 
 
     def set_title(self, title):
+      if title == self._title:
+        return
       self._title = title
+      self._dirty = True
 
 
-    def _draw_content(self):
-      return self._parent._renderer.draw_text_in_viewport(self, self._title)
+    def _visible_lines(self, n):
+      # Split only the first n lines of the title, so a long text block does not
+      # get fully materialized when just a few rows of it fit in the widget
+      title = self._title
+      pos = -1
+      for _ in range(n):
+        pos = title.find('\n', pos + 1)
+        if pos < 0:
+          return title.splitlines()[:n]
+      return title[:pos + 1].splitlines()[:n]
 
 
+    def _draw_content(self):
+      if self._style['vertical_alignment'] == 'top':
+        lines = self._visible_lines(self.get_viewport_height())
+      else:
+        # Other alignments position the block by its total line count
+        lines = self._title.splitlines()
+      return self._parent._renderer.draw_text_in_viewport(self, lines)
@@ -1,3 +1,5 @@
+import itertools
+
 import py_cui.keys
 from .widget import Widget
 from py_cui.ui import UIImplementation
@@ -31,6 +33,8 @@ class MenuImplementation(UIImplementation):
         self._selected_item    = 0
         self._page_scroll_len  = 5
         self._view_items       = []
+        # (selected item, item count) the footer was last built from
+        self._footer_key       = None
 
 
     def clear(self):
@@ -41,6 +45,7 @@ class MenuImplementation(UIImplementation):
         self._selected_item = 0
         self._top_view = 0
         self._bottom_view = 0
+        self._dirty = True
 
         self._logger.info('Clearing menu')
 
@@ -68,11 +73,38 @@ class MenuImplementation(UIImplementation):
         """
 
         self._selected_item = selected_item_index
+        self._dirty = True
+
+
+    def _get_item_index_at(self, y, viewport_top):
+        """Gets the index of the menu item drawn on a given screen row
+
+        Parameters
+        ----------
+        y : int
+            Screen row that was clicked
+        viewport_top : int
+            First screen row of the menu viewport
+
+        Returns
+        -------
+        index : int
+            Index of the item on that row, or None if no item is drawn there
+        """
+
+        index = y - viewport_top + self._top_view
+        if self._top_view <= index < len(self._view_items):
+            return index
+        return None
 
 
     def _set_footer(self):
-        if self.get_item_size() > 0:
-            self.set_footer('{}/{}'.format(self._selected_item + 1, self.get_item_size()))
+        key = (self._selected_item, len(self._view_items))
+        if key == self._footer_key:
+            return
+        self._footer_key = key
+        if key[1] > 0:
+            self.set_footer('{}/{}'.format(key[0] + 1, key[1]))
         else:
             self.set_footer('')
 
@@ -85,8 +117,9 @@ class MenuImplementation(UIImplementation):
             if self._selected_item == self._top_view:
                 self._top_view -= 1
             self._selected_item -= 1
+            self._dirty = True
 
-        self._logger.info('Scrolling up to item {}'.format(self._selected_item))
+        self._logger.info('Scrolling up to item %s', self._selected_item)
 
 
     def _scroll_down(self):
@@ -97,24 +130,41 @@ class MenuImplementation(UIImplementation):
             self._selected_item += 1
             if self._selected_item > self._bottom_view:
                 self._top_view += 1
+            self._dirty = True
 
-        self._logger.info('Scrolling down to item {}'.format(self._selected_item))
+        self._logger.info('Scrolling down to item %s', self._selected_item)
 
 
     def _page_up(self):
         """Function for jumping up menu several spots at a time
         """
 
-        for _ in range(self._page_scroll_len):
-            self._scroll_up()
+        # Same result as _page_scroll_len calls to _scroll_up, computed in one step
+        steps = min(self._page_scroll_len, self._selected_item)
+        if steps > 0:
+            old_selected = self._selected_item
+            self._selected_item -= steps
+            if old_selected >= self._top_view:
+                self._top_view = min(self._top_view, self._selected_item)
+            self._dirty = True
+
+        self._logger.info('Scrolling up to item %d', self._selected_item)
 
 
     def _page_down(self):
         """Function for jumping down the menu several spots at a time
         """
 
-        for _ in range(self._page_scroll_len):
-            self._scroll_down()
+        # Same result as _page_scroll_len calls to _scroll_down, computed in one step
+        steps = min(self._page_scroll_len, len(self._view_items) - 1 - self._selected_item)
+        if steps > 0:
+            old_selected = self._selected_item
+            self._selected_item += steps
+            # The view moves down once for every step that lands below the bottom item
+            self._top_view += max(0, self._selected_item - max(self._bottom_view, old_selected))
+            self._dirty = True
+
+        self._logger.info('Scrolling down to item %d', self._selected_item)
 
 
     def _jump_to_top(self):
@@ -123,6 +173,7 @@ class MenuImplementation(UIImplementation):
 
         self._top_view      = 0
         self._selected_item = 0
+        self._dirty = True
 
 
     def _jump_to_bottom(self, viewport_height):
@@ -138,6 +189,14 @@ class MenuImplementation(UIImplementation):
         self._top_view = self._selected_item - viewport_height
         if self._top_view < 0:
             self._top_view = 0
+        self._dirty = True
+
+
+    def _jump_to_view_bottom(self):
+        """Jumps to the bottom of the menu, using the element's viewport height
+        """
+
+        self._jump_to_bottom(self.get_viewport_height())
 
 
     def add_item(self, item):
@@ -149,8 +208,9 @@ class MenuImplementation(UIImplementation):
             Object to add to the menu. Must have implemented __str__ function
         """
 
-        self._logger.info('Adding item {} to menu'.format(str(item)))
+        self._logger.info('Adding item %s to menu', item)
         self._view_items.append(item)
+        self._dirty = True
         self._set_footer()
 
 
@@ -163,9 +223,11 @@ class MenuImplementation(UIImplementation):
             list of objects to add as items to the scrollmenu
         """
 
-        self._logger.info('Adding item list {} to menu'.format(str(item_list)))
-        for item in item_list:
-            self.add_item(item)
+        self._logger.info('Adding item list %s to menu', item_list)
+        # Extend once and rebuild the footer once, rather than per item
+        self._view_items.extend(item_list)
+        self._dirty = True
+        self._set_footer()
 
 
     def remove_selected_item(self):
@@ -174,10 +236,11 @@ class MenuImplementation(UIImplementation):
 
         if len(self._view_items) == 0:
             return
-        self._logger.info('Removing {}'.format(str(self._view_items[self._selected_item])))
+        self._logger.info('Removing %s', self._view_items[self._selected_item])
         del self._view_items[self._selected_item]
         if self._selected_item >= len(self._view_items) and self._selected_item > 0:
             self._selected_item = self._selected_item - 1
+        self._dirty = True
         self._set_footer()
 
 
@@ -190,19 +253,23 @@ class MenuImplementation(UIImplementation):
             Reference of item to remove
         """
 
-        if len(self._view_items) == 0 or item not in self._view_items:
+        # A single scan both checks membership and finds the position
+        try:
+            i_index = self._view_items.index(item)
+        except ValueError:
             return
-        self._logger.info('Removing {}'.format(str(item)))
-        i_index = self._view_items.index(item)
+        self._logger.info('Removing %s', item)
         del self._view_items[i_index]
         if self._selected_item >= i_index:
             self._selected_item = self._selected_item - 1
+        self._dirty = True
         self._set_footer()
 
 
     def clear_items(self):
-        while self.get_item_size() > 0:
-            self.remove_selected_item()
+        # Reset in one step instead of removing the items one at a time
+        self.clear()
+        self._set_footer()
 
 
     def get_item_list(self):
@@ -246,12 +313,23 @@ class MenuImplementation(UIImplementation):
 
         if selected_item is not None and self.get() is not None:
             self._view_items[self._selected_item] = selected_item
+            self._dirty = True
 
 
 class ScrollMenu(Widget, MenuImplementation):
     """A scroll menu widget.
     """
 
+    # Maps navigation keys to the name of the method that handles them
+    _KEY_HANDLERS = {
+        py_cui.keys.KEY_UP_ARROW:   '_scroll_up',
+        py_cui.keys.KEY_DOWN_ARROW: '_scroll_down',
+        py_cui.keys.KEY_PAGE_UP:    '_page_up',
+        py_cui.keys.KEY_PAGE_DOWN:  '_page_down',
+        py_cui.keys.KEY_HOME:       '_jump_to_top',
+        py_cui.keys.KEY_END:        '_jump_to_view_bottom',
+    }
+
     def __init__(self, parent, title):
         """Initializer for scroll menu. calls superclass initializers and sets help text
         """
@@ -273,8 +351,8 @@ class ScrollMenu(Widget, MenuImplementation):
 
         super()._handle_mouse_press(x, y)
         _, viewport_top = self.get_viewport_start_pos()
-        if viewport_top <= y and viewport_top + len(self._view_items) - self._top_view >= y:
-            elem_clicked = y - viewport_top + self._top_view
+        elem_clicked = self._get_item_index_at(y, viewport_top)
+        if elem_clicked is not None:
             self.set_selected_item_index(elem_clicked)
         self._set_footer()
 
@@ -292,19 +370,9 @@ class ScrollMenu(Widget, MenuImplementation):
 
         super()._handle_key_press(key_pressed)
 
-        if key_pressed == py_cui.keys.KEY_UP_ARROW:
-            self._scroll_up()
-        elif key_pressed == py_cui.keys.KEY_DOWN_ARROW:
-            self._scroll_down()
-        elif key_pressed == py_cui.keys.KEY_PAGE_UP:
-            self._page_up()
-        elif key_pressed == py_cui.keys.KEY_PAGE_DOWN:
-            self._page_down()
-        elif key_pressed == py_cui.keys.KEY_HOME:
-            self._jump_to_top()
-        elif key_pressed == py_cui.keys.KEY_END:
-            # TODO: fix
-            self._jump_to_bottom(self.get_viewport_height())
+        handler = self._KEY_HANDLERS.get(key_pressed)
+        if handler is not None:
+            getattr(self, handler)()
         self._set_footer()
 
 
@@ -312,16 +380,24 @@ class ScrollMenu(Widget, MenuImplementation):
         start_x, posy = self.get_viewport_start_pos()
         stop_x, stop_y = self.get_viewport_stop_pos()
         self._bottom_view = self._top_view
-        for itemi in range(self._top_view, len(self._view_items)):
-            posy += self._parent._renderer.draw_text_in(
-                self, str(self._view_items[itemi]),
-                start_x, stop_x,
-                posy, stop_y,
-                selected=itemi == self._selected_item)
+        top = self._top_view
+        selected = self._selected_item
+        # Collect the visible rows, then hand them to the renderer in one call
+        rows = []
+        append = rows.append
+        # Walk the items from the top of the view without copying the tail of the list
+        for itemi, item in enumerate(itertools.islice(self._view_items, top, None), top):
+            is_selected = itemi == selected
+            for line in str(item).splitlines():
+                if posy > stop_y:
+                    break
+                append((posy, line, is_selected))
+                posy += 1
             if posy <= stop_y + 1:
               self._bottom_view = itemi
             if posy >= stop_y + 1:
                 break
+        self._parent._renderer.draw_text_batch(self, rows, start_x, stop_x)
 
 
     def _draw_scrollbar(self):
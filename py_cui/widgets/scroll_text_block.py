@@ -3,6 +3,10 @@ from py_cui.ui import UIImplementation
 import py_cui.keys
 
 
+# One character strings for the ASCII key codes, so typing does not call chr() per key
+_ASCII_CHARS = tuple(chr(i) for i in range(128))
+
+
 class TextBlockImplementation(UIImplementation):
     """Base class for TextBlockImplementation
 
@@ -33,6 +37,8 @@ class TextBlockImplementation(UIImplementation):
 
         super().__init__(logger)
         self._text_lines = ['']
+        # Cursor text position the footer was last built from
+        self._footer_key = None
         self._viewable_text_y = 0
         self._viewable_text_x = 0
         self._cursor_text_x = 0
@@ -61,25 +67,50 @@ class TextBlockImplementation(UIImplementation):
         """
 
         lines = text.splitlines()
-        if len(self._text_lines) == 1 and self._text_lines[0] == '':
-            self.set_text(text)
+        if len(self._text_lines) == 1 and not self._text_lines[0]:
+            # Same as set_text
+            self._reset_cursor()
+            self._text_lines = lines or ['']
+            self._set_footer()
         else:
             self._text_lines.extend(lines)
+        self._dirty = True
 
 
     def clear(self):
         """Function that clears the text block
         """
 
+        self._reset_cursor()
+        self._text_lines = ['']
+        self._dirty = True
+        self._set_footer()
+        self._logger.info('Cleared textblock')
+
+
+    def _reset_cursor(self):
+        """Moves the cursor and the view back to the start of the text
+        """
+
         self._cursor_x = self._cursor_max_left
         self._cursor_y = self._cursor_max_up
         self._cursor_text_x = 0
         self._cursor_text_y = 0
         self._viewable_text_y   = 0
         self._viewable_text_x   = 0
-        self._text_lines = ['']
-        self._set_footer()
-        self._logger.info('Cleared textblock')
+
+
+    def get(self):
+        """Gets all of the text in the textblock and returns it
+
+        Returns
+        -------
+        text : str
+            The current text in the text block, with each line ending in a newline
+        """
+
+        # join sizes the result once, instead of copying the text so far for every line
+        return '\n'.join(self._text_lines) + '\n'
 
 
     def get_current_line(self):
@@ -105,10 +136,10 @@ class TextBlockImplementation(UIImplementation):
             text to write into text block
         """
 
-        self.clear()
-        self._text_lines = text.splitlines()
-        if len(self._text_lines) == 0:
-            self._text_lines.append('')
+        self._reset_cursor()
+        self._text_lines = text.splitlines() or ['']
+        self._dirty = True
+        self._set_footer()
 
 
     def set_text_line(self, text):
@@ -123,11 +154,15 @@ class TextBlockImplementation(UIImplementation):
         """
 
         self._text_lines[self._cursor_text_y] = text
+        self._dirty = True
 
 
     def _set_footer(self):
-        x, y = self.get_cursor_text_pos()
-        self.set_footer('{}:{}'.format(x + 1, y + 1))
+        key = self.get_cursor_text_pos()
+        if key == self._footer_key:
+            return
+        self._footer_key = key
+        self.set_footer('{}:{}'.format(key[0] + 1, key[1] + 1))
 
     def _move_left(self):
         if self._cursor_text_x > 0:
@@ -139,88 +174,100 @@ class TextBlockImplementation(UIImplementation):
 
 
     def _move_right(self):
-        current_line = self.get_current_line()
-        if self._cursor_text_x < len(current_line):
+        length = len(self.get_current_line())
+        if self._cursor_text_x < length:
           if self._cursor_x < self._cursor_max_right:
             self._cursor_x += 1
-          elif self._viewable_text_x + self._viewport_width < len(current_line):
+          elif self._viewable_text_x + self._viewport_width < length:
             self._viewable_text_x += 1
           self._cursor_text_x += 1
 
 
-    def _move_up(self):
-      if self._cursor_text_y > 0:
-        if self._cursor_y > self._cursor_max_up:
-          self._cursor_y -= 1
-        elif self._viewable_text_y > 0:
-          self._viewable_text_y -= 1
-        self._cursor_text_y -= 1
-        if self._cursor_text_x > len(self._text_lines[self._cursor_text_y]):
-          length = len(self._text_lines[self._cursor_text_y])
-          self._cursor_x -= self._cursor_text_x - length
-          self._cursor_text_x = length
-
-
-    def _move_down(self):
-      if self._cursor_text_y < len(self._text_lines) - 1:
-        if self._cursor_y < self._cursor_max_down:
-          self._cursor_y += 1
-        elif self._viewable_text_y + self._viewport_height < len(self._text_lines):
-          self._viewable_text_y += 1
-        self._cursor_text_y += 1
-        if self._cursor_text_x > len(self._text_lines[self._cursor_text_y]):
-          length = len(self._text_lines[self._cursor_text_y])
-          self._cursor_x -= self._cursor_text_x - length
-          self._cursor_text_x = length
+    def _move_up(self, count=1):
+      # Moving by count lines at once: the cursor moves first, then the view scrolls
+      count = min(count, self._cursor_text_y)
+      if count <= 0:
+        return
+      cursor_steps = min(count, max(0, self._cursor_y - self._cursor_max_up))
+      self._cursor_y -= cursor_steps
+      self._viewable_text_y -= min(count - cursor_steps, self._viewable_text_y)
+      old_text_y = self._cursor_text_y
+      self._cursor_text_y -= count
+      self._dirty = True
+      self._clamp_cursor_text_x(self._text_lines[self._cursor_text_y:old_text_y])
+
+
+    def _move_down(self, count=1):
+      count = min(count, len(self._text_lines) - 1 - self._cursor_text_y)
+      if count <= 0:
+        return
+      cursor_steps = min(count, max(0, self._cursor_max_down - self._cursor_y))
+      self._cursor_y += cursor_steps
+      self._viewable_text_y += max(0, min(count - cursor_steps,
+                                          len(self._text_lines) - self._viewport_height - self._viewable_text_y))
+      old_text_y = self._cursor_text_y
+      self._cursor_text_y += count
+      self._dirty = True
+      self._clamp_cursor_text_x(self._text_lines[old_text_y + 1:self._cursor_text_y + 1])
+
+
+    def _clamp_cursor_text_x(self, passed_lines):
+      # The cursor column is pulled back to the shortest line it moved across
+      length = min(map(len, passed_lines))
+      if self._cursor_text_x > length:
+        self._cursor_x -= self._cursor_text_x - length
+        self._cursor_text_x = length
 
 
     def _page_up(self):
-      for _ in range(self._viewport_height):
-        self._move_up()
+      self._move_up(self._viewport_height)
 
 
     def _page_down(self):
-      for _ in range(self._viewport_height):
-        self._move_down()
+      self._move_down(self._viewport_height)
 
 
     def _handle_newline(self):
-        current_line = self.get_current_line()
-        self._logger.info('Inserting newline in location {}'.format(self._cursor_text_x))
-
-        new_line_1 = current_line[:self._cursor_text_x]
-        new_line_2 = current_line[self._cursor_text_x:]
-        self._text_lines[self._cursor_text_y] = new_line_1
-        self._text_lines.insert(self._cursor_text_y + 1, new_line_2)
-        self._cursor_text_y += 1
+        lines = self._text_lines
+        x, y = self._cursor_text_x, self._cursor_text_y
+        current_line = lines[y]
+        self._logger.info('Inserting newline in location %s', x)
+
+        lines[y] = current_line[:x]
+        lines.insert(y + 1, current_line[x:])
+        self._dirty = True
+        self._cursor_text_y = y + 1
         self._cursor_text_x = 0
         self._cursor_x = self._cursor_max_left
         self._viewable_text_x = 0
         if self._cursor_y < self._cursor_max_down:
           self._cursor_y += 1
-        elif self._viewable_text_y + self._viewport_height < len(self._text_lines):
+        elif self._viewable_text_y + self._viewport_height < len(lines):
           self._viewable_text_y += 1
 
 
     def _handle_backspace(self):
-        current_line = self.get_current_line()
-        self._logger.info('Inserting backspace in location {}'.format(self._cursor_text_x))
-
-        if self._cursor_text_x == 0 and self._cursor_text_y != 0:
-          self._cursor_text_x = len(self._text_lines[self._cursor_text_y - 1])
-          self._text_lines[self._cursor_text_y - 1] = self._text_lines[self._cursor_text_y - 1] + self._text_lines[self._cursor_text_y]
-          self._text_lines = self._text_lines[:self._cursor_text_y] + self._text_lines[self._cursor_text_y + 1:]
-          self._cursor_text_y -= 1
+        lines = self._text_lines
+        x, y = self._cursor_text_x, self._cursor_text_y
+        current_line = lines[y]
+        self._logger.info('Inserting backspace in location %s', x)
+
+        if x == 0 and y != 0:
+          self._cursor_text_x = len(lines[y - 1])
+          # Join in place, rather than rebuilding the whole list of lines
+          lines[y - 1] += lines.pop(y)
+          self._dirty = True
+          self._cursor_text_y = y - 1
           self._cursor_x = self._cursor_max_left + self._cursor_text_x
           if self._cursor_y > self._cursor_max_up:
             self._cursor_y -= 1
           elif self._viewable_text_y > 0:
             self._viewable_text_y -= 1
-        elif self._cursor_text_x > 0:
-          self.set_text_line(current_line[:self._cursor_text_x - 1] + current_line[self._cursor_text_x:])
+        elif x > 0:
+          self.set_text_line(current_line[:x - 1] + current_line[x:])
           if len(current_line) <= self._viewport_width:
             self._cursor_x -= 1
-          self._cursor_text_x -= 1
+          self._cursor_text_x = x - 1
 
 
     def _handle_home(self):
@@ -230,41 +277,84 @@ class TextBlockImplementation(UIImplementation):
 
 
     def _handle_end(self):
-      current_line = self.get_current_line()
+      length = len(self.get_current_line())
 
-      self._cursor_text_x = len(current_line)
-      if len(current_line) > self._viewport_width:
+      self._cursor_text_x = length
+      if length > self._viewport_width:
         self._cursor_x = self._cursor_max_right
-        self._viewable_text_x = self._cursor_text_x - self._viewport_width
+        self._viewable_text_x = length - self._viewport_width
       else:
-        self._cursor_x = self._cursor_max_left + len(current_line)
+        self._cursor_x = self._cursor_max_left + length
 
 
     def _handle_delete(self):
-      current_line = self.get_current_line()
+      lines = self._text_lines
+      x, y = self._cursor_text_x, self._cursor_text_y
+      current_line = lines[y]
+      length = len(current_line)
+
+      if x == length and y < len(lines) - 1:
+        lines[y] += lines.pop(y + 1)
+        self._dirty = True
+      elif x < length:
+        self.set_text_line(current_line[:x] + current_line[x + 1:])
+
 
-      if self._cursor_text_x == len(current_line) and self._cursor_text_y < len(self._text_lines) - 1:
-        self._text_lines[self._cursor_text_y] = self._text_lines[self._cursor_text_y] + self._text_lines[self._cursor_text_y + 1]
-        self._text_lines = self._text_lines[:self._cursor_text_y+1] + self._text_lines[self._cursor_text_y + 2:]
-      elif self._cursor_text_x < len(current_line):
-        self.set_text_line(current_line[:self._cursor_text_x] + current_line[self._cursor_text_x+1:])
+    def _insert_tab(self):
+      self._insert_str('    ')
+
+
+    def _insert_str(self, text):
+      # Same result as calling _insert_char for each character, with one line rebuild
+      x = self._cursor_text_x
+      current_line = self._text_lines[self._cursor_text_y]
+      count = len(text)
+      length = len(current_line)
+      width = self._viewport_width
+
+      self.set_text_line(current_line[:x] + text + current_line[x:])
+      # The cursor advances while the line still fits, after that the view scrolls
+      # once the line has grown past the right edge of the view
+      cursor_steps = min(max(width - length + 1, 0), count)
+      first_scroll = max(cursor_steps, self._viewable_text_x + width - length + 1)
+      self._cursor_x += cursor_steps
+      self._viewable_text_x += max(count - first_scroll, 0)
+      self._cursor_text_x = x + count
 
 
     def _insert_char(self, key_pressed):
-      current_line = self.get_current_line()
+      x = self._cursor_text_x
+      current_line = self._text_lines[self._cursor_text_y]
+      length = len(current_line)
 
-      self.set_text_line(current_line[:self._cursor_text_x] + chr(key_pressed) + current_line[self._cursor_text_x:])
-      if len(current_line) <= self._viewport_width:
+      self.set_text_line(current_line[:x] + _ASCII_CHARS[key_pressed] + current_line[x:])
+      if length <= self._viewport_width:
         self._cursor_x += 1
-      elif self._viewable_text_x + self._viewport_width < len(current_line):
+      elif self._viewable_text_x + self._viewport_width < length:
         self._viewable_text_x += 1
-      self._cursor_text_x += 1
+      self._cursor_text_x = x + 1
 
 
 class ScrollTextBlock(Widget, TextBlockImplementation):
     """Widget for editing large multi-line blocks of text
     """
 
+    # Maps editing and navigation keys to the name of the method that handles them
+    _KEY_HANDLERS = {
+        py_cui.keys.KEY_LEFT_ARROW:  '_move_left',
+        py_cui.keys.KEY_RIGHT_ARROW: '_move_right',
+        py_cui.keys.KEY_UP_ARROW:    '_move_up',
+        py_cui.keys.KEY_DOWN_ARROW:  '_move_down',
+        py_cui.keys.KEY_PAGE_UP:     '_page_up',
+        py_cui.keys.KEY_PAGE_DOWN:   '_page_down',
+        py_cui.keys.KEY_BACKSPACE:   '_handle_backspace',
+        py_cui.keys.KEY_DELETE:      '_handle_delete',
+        py_cui.keys.KEY_ENTER:       '_handle_newline',
+        py_cui.keys.KEY_TAB:         '_insert_tab',
+        py_cui.keys.KEY_HOME:        '_handle_home',
+        py_cui.keys.KEY_END:         '_handle_end',
+    }
+
     def __init__(self, parent, title):
       Widget.__init__(self, parent, title)
       TextBlockImplementation.__init__(self, parent._logger)
@@ -290,23 +380,24 @@ class ScrollTextBlock(Widget, TextBlockImplementation):
       if y >= self._cursor_max_up and y <= self._cursor_max_down:
         if x >= self._cursor_max_left and x <= self._cursor_max_right:
           line_clicked_index = y - self._cursor_max_up + self._viewable_text_y
-          if len(self._text_lines) <= line_clicked_index:
-            self._cursor_text_y = len(self._text_lines) - 1
+          line_count = len(self._text_lines)
+          if line_count <= line_clicked_index:
+            self._cursor_text_y = line_count - 1
             self._cursor_y = self._cursor_max_up + self._cursor_text_y - self._viewable_text_y
-            line = self._text_lines[len(self._text_lines) - 1]
+            length = len(self._text_lines[-1])
           else:
             self._cursor_text_y = line_clicked_index
             self._cursor_y = y
-            line = self._text_lines[line_clicked_index]
+            length = len(self._text_lines[line_clicked_index])
 
-          if x <= len(line) + self._cursor_max_left:
+          if x <= length + self._cursor_max_left:
             old_text_pos = self._cursor_text_x
             old_cursor_x = self._cursor_x
             self._cursor_x = x
             self._cursor_text_x = old_text_pos + (x - old_cursor_x)
           else:
-            self._cursor_x = self._cursor_max_left + len(line)
-            self._cursor_text_x = len(line)
+            self._cursor_x = self._cursor_max_left + length
+            self._cursor_text_x = length
       self._set_footer()
 
 
@@ -314,20 +405,9 @@ class ScrollTextBlock(Widget, TextBlockImplementation):
       if super()._handle_key_press(key_pressed):
           return
 
-      if key_pressed == py_cui.keys.KEY_LEFT_ARROW: self._move_left()
-      elif key_pressed == py_cui.keys.KEY_RIGHT_ARROW: self._move_right()
-      elif key_pressed == py_cui.keys.KEY_UP_ARROW: self._move_up()
-      elif key_pressed == py_cui.keys.KEY_DOWN_ARROW: self._move_down()
-      elif key_pressed == py_cui.keys.KEY_PAGE_UP: self._page_up()
-      elif key_pressed == py_cui.keys.KEY_PAGE_DOWN: self._page_down()
-      elif key_pressed == py_cui.keys.KEY_BACKSPACE: self._handle_backspace()
-      elif key_pressed == py_cui.keys.KEY_DELETE: self._handle_delete()
-      elif key_pressed == py_cui.keys.KEY_ENTER: self._handle_newline()
-      elif key_pressed == py_cui.keys.KEY_TAB:
-          for _ in range(0, 4):
-              self._insert_char(py_cui.keys.KEY_SPACE)
-      elif key_pressed == py_cui.keys.KEY_HOME: self._handle_home()
-      elif key_pressed == py_cui.keys.KEY_END: self._handle_end()
+      handler = self._KEY_HANDLERS.get(key_pressed)
+      if handler is not None:
+          getattr(self, handler)()
       elif key_pressed > 31 and key_pressed < 128:
           self._insert_char(key_pressed)
       self._set_footer()
@@ -337,13 +417,23 @@ class ScrollTextBlock(Widget, TextBlockImplementation):
       startx, starty = self.get_viewport_start_pos()
       stopx, stopy = self.get_viewport_stop_pos()
       posy = starty
-      self.lastline = self._viewable_text_y
-      for linei in range(self._viewable_text_y, self._viewable_text_y + self._viewport_height):
-        render_text = self._text_lines[linei] if linei < len(self._text_lines) else ''
-        self._parent._renderer.draw_text_in(self, render_text,
-            startx, stopx, posy, stopy, selected=self._focused)
-        self.lastline = linei
+      selected = self._focused
+      top = self._viewable_text_y
+      end = top + self._viewport_height
+      # Only the rows holding text are drawn, rows past the last line stay blank.
+      # They are collected first and handed to the renderer in one call.
+      rows = []
+      append = rows.append
+      for render_text in self._text_lines[top:end]:
+        y = posy
+        for line in render_text.splitlines():
+          if y > stopy:
+            break
+          append((y, line, selected))
+          y += 1
         posy += 1
+      self._parent._renderer.draw_text_batch(self, rows, startx, stopx)
+      self.lastline = end - 1 if end > top else top
 
 
     def _draw_scrollbar(self):
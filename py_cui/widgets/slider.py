@@ -15,6 +15,10 @@ class SliderImplementation(UIImplementation):
 
         self._bar_char = "#"
 
+        # Bounds never change after construction, so their derived values are computed once
+        self._min_str = str(min_val)
+        self._value_range = max_val - min_val
+
         if self._cur_val < self._min_val or self._cur_val > self._max_val:
             raise py_cui.errors.PyCUIInvalidValue(
                 'initial value must be between {} and {}'
@@ -33,6 +37,7 @@ class SliderImplementation(UIImplementation):
 
         assert len(char) == 1, "char should contain exactly one character, got {} instead.".format(len(char))
         self._bar_char = char
+        self._dirty = True
 
 
     def update_slider_value(self, offset: int) -> float:
@@ -51,15 +56,19 @@ class SliderImplementation(UIImplementation):
         """
 
         # direction , 1 raise value, -1 lower value
-        self._cur_val += (offset * self._step)
+        value = self._cur_val + offset * self._step
 
-        if self._cur_val < self._min_val:
-            self._cur_val = self._min_val
+        if value < self._min_val:
+            value = self._min_val
 
-        elif self._cur_val > self._max_val:
-            self._cur_val = self._max_val
+        elif value > self._max_val:
+            value = self._max_val
 
-        return self._cur_val
+        # Holding a key at either end of the range leaves nothing to redraw
+        if value != self._cur_val:
+            self._cur_val = value
+            self._dirty = True
+        return value
 
 
     def get_slider_value(self):
@@ -104,6 +113,12 @@ class Slider(Widget, SliderImplementation):
         Initial value of the slider
     """
 
+    # Maps the adjustment keys to the number of steps they move the value
+    _KEY_STEPS = {
+        py_cui.keys.KEY_LEFT_ARROW:  -1,
+        py_cui.keys.KEY_RIGHT_ARROW: 1,
+    }
+
     def __init__(self, parent, title,
                  min_val=0, max_val=100, step=1, init_val=50):
 
@@ -113,9 +128,10 @@ class Slider(Widget, SliderImplementation):
 
         self._parent = parent
         self._display_value = True
-        self._style['draw_border'] = True
-        self._style['single_line_mode'] = True
-        self._style['vertical_alignment'] = 'top'
+        self._bar_cache     = None
+        self.set_style('draw_border', True)
+        self.set_style('single_line_mode', True)
+        self.set_style('vertical_alignment', 'top')
         self.set_help_text("Focus mode on Slider. Use left/right to adjust value. Esc to exit.")
 
 
@@ -124,6 +140,7 @@ class Slider(Widget, SliderImplementation):
         """
 
         self._title_enabled = not self._title_enabled
+        self._dirty = True
 
 
     def toggle_border(self):
@@ -131,6 +148,7 @@ class Slider(Widget, SliderImplementation):
         """
 
         self._border_enabled = not self._border_enabled
+        self._dirty = True
 
 
     def toggle_value(self):
@@ -138,6 +156,7 @@ class Slider(Widget, SliderImplementation):
         """
 
         self._display_value = not self._display_value
+        self._dirty = True
 
 
     def _generate_bar(self, width: int) -> str:
@@ -154,23 +173,31 @@ class Slider(Widget, SliderImplementation):
         progress: str
             progressive bar string  with length of width.
         """
+
+        key = (width, self._cur_val, self._display_value, self._bar_char)
+        if self._bar_cache is not None and self._bar_cache[0] == key:
+            return self._bar_cache[1]
+
+        offset = self._cur_val - self._min_val
         if self._display_value:
-            min_string = str(self._min_val)
+            min_string = self._min_str
             value_str = str(int(self._cur_val))
 
             width -= len(min_string)
 
-            bar = self._bar_char * int((width * (self._cur_val - self._min_val)) / (self._max_val - self._min_val))
-            progress = (self._bar_char * len(min_string) + bar)[: -len(value_str)] + value_str
+            # The value text replaces the tail of the bar, so the bar is built at its final length
+            filled = len(min_string) + int((width * offset) / self._value_range) - len(value_str)
+            progress = self._bar_char * max(filled, 0) + value_str
         else:
-            progress = self._bar_char * int((width * (self._cur_val - self._min_val)) / (self._max_val - self._min_val))
+            progress = self._bar_char * int((width * offset) / self._value_range)
 
+        self._bar_cache = (key, progress)
         return progress
 
 
     def _draw_content(self):
         width = self.get_viewport_width()
-        self._parent._renderer.draw_text_in_viewport(
+        self._renderer.draw_text_in_viewport(
             self, self._generate_bar(width), selected=self.is_focused())
 
 
@@ -185,9 +212,8 @@ class Slider(Widget, SliderImplementation):
         """
 
         super()._handle_key_press(key_pressed)
-        if key_pressed == py_cui.keys.KEY_LEFT_ARROW:
-            self.update_slider_value(-1)
-        if key_pressed == py_cui.keys.KEY_RIGHT_ARROW:
-            self.update_slider_value(1)
+        offset = self._KEY_STEPS.get(key_pressed)
+        if offset is not None:
+            self.update_slider_value(offset)
 
 
@@ -3,6 +3,10 @@ from py_cui.ui import UIImplementation
 import py_cui.keys
 
 
+# Key codes that are typed into the text box as characters
+_PRINTABLE_KEYS = frozenset(range(32, 128)) | frozenset(range(1001, 1128))
+
+
 class TextBoxImplementation(UIImplementation):
     """UI implementation for a single-row textbox input
 
@@ -112,6 +116,7 @@ class TextBoxImplementation(UIImplementation):
         """
 
         self._text = text
+        self._dirty = True
         if self._cursor_text_pos > len(self._text):
             diff = self._cursor_text_pos - len(self._text)
             self._cursor_text_pos = len(self._text)
@@ -137,6 +142,7 @@ class TextBoxImplementation(UIImplementation):
         self._cursor_x         = self._cursor_max_left
         self._cursor_text_pos  = 0
         self._text             = ''
+        self._dirty            = True
 
 
     def _move_left(self):
@@ -166,10 +172,11 @@ class TextBoxImplementation(UIImplementation):
         key_pressed : int
             key code of key pressed
         """
-        self._text = self._text[:self._cursor_text_pos] + chr(key_pressed) + self._text[self._cursor_text_pos:]
-        if len(self._text) < self._viewport_width:
+        text, pos = self._text, self._cursor_text_pos
+        self._text = text[:pos] + chr(key_pressed) + text[pos:]
+        if len(text) + 1 < self._viewport_width:
             self._cursor_x = self._cursor_x + 1
-        self._cursor_text_pos = self._cursor_text_pos + 1
+        self._cursor_text_pos = pos + 1
 
 
     def _jump_to_start(self):
@@ -192,33 +199,47 @@ class TextBoxImplementation(UIImplementation):
         """Erases character at textbox cursor. Internal Use only
         """
 
-        if self._cursor_text_pos > 0:
-            self._text = self._text[:self._cursor_text_pos - 1] + self._text[self._cursor_text_pos:]
-            if len(self._text) < self._viewport_width:
+        text, pos = self._text, self._cursor_text_pos
+        if pos > 0:
+            self._text = text[:pos - 1] + text[pos:]
+            if len(text) - 1 < self._viewport_width:
                 self._cursor_x = self._cursor_x - 1
-            self._cursor_text_pos = self._cursor_text_pos - 1
+            self._cursor_text_pos = pos - 1
 
 
     def _delete_char(self):
         """Deletes character to right of texbox cursor. Internal use only
         """
 
-        if self._cursor_text_pos < len(self._text):
-            self._text = self._text[:self._cursor_text_pos] + self._text[self._cursor_text_pos + 1:]
+        text, pos = self._text, self._cursor_text_pos
+        if pos < len(text):
+            self._text = text[:pos] + text[pos + 1:]
 
 
 class TextBox(Widget, TextBoxImplementation):
     """Widget for entering small single lines of text
     """
 
+    # Maps editing and navigation keys to the name of the method that handles them
+    _KEY_HANDLERS = {
+        py_cui.keys.KEY_LEFT_ARROW:  '_move_left',
+        py_cui.keys.KEY_RIGHT_ARROW: '_move_right',
+        py_cui.keys.KEY_BACKSPACE:   '_erase_char',
+        py_cui.keys.KEY_DELETE:      '_delete_char',
+        py_cui.keys.KEY_HOME:        '_jump_to_start',
+        py_cui.keys.KEY_END:         '_jump_to_end',
+    }
+
     def __init__(self, parent, title, password=False):
         """Initializer for TextBox widget. Uses TextBoxImplementation as base
         """
 
         Widget.__init__(self, parent, title)
         TextBoxImplementation.__init__(self, password, parent._logger)
-        self._style['single_line_mode'] = True
+        self.set_style('single_line_mode', True)
         self._parent = parent
+        # Last visible text, keyed on everything it is computed from
+        self._render_cache = None
         self.set_help_text('Focus mode on TextBox. Press Esc to exit focus mode.')
 
 
@@ -230,6 +251,8 @@ class TextBox(Widget, TextBoxImplementation):
         self._initial_cursor = self._cursor_x
         self._cursor_text_pos = 0
         self._viewport_width = self.get_viewport_width()
+        # The visible text is never wider than the viewport, so its mask is a slice of this
+        self._password_mask = '*' * self._viewport_width
 
 
     def _handle_mouse_press(self, x, y):
@@ -243,53 +266,52 @@ class TextBox(Widget, TextBoxImplementation):
 
         super()._handle_mouse_press(x, y)
         if y == self._cursor_y and x >= self._cursor_max_left and x <= self._cursor_max_right:
-            if x <= len(self._text) + self._cursor_max_left:
-                old_text_pos = self._cursor_text_pos
-                old_cursor_x = self._cursor_x
+            length = len(self._text)
+            if x <= self._cursor_max_left + length:
+                # Relative to the old cursor, as the view may be scrolled along a long text
+                self._cursor_text_pos += x - self._cursor_x
                 self._cursor_x = x
-                self._cursor_text_pos = old_text_pos + (x - old_cursor_x)
             else:
-                self._cursor_x = self._cursor_max_left + len(self._text)
-                self._cursor_text_pos = len(self._text)
+                self._cursor_x = self._cursor_max_left + length
+                self._cursor_text_pos = length
 
 
     def _handle_key_press(self, key_pressed):
         super()._handle_key_press(key_pressed)
-        if key_pressed == py_cui.keys.KEY_LEFT_ARROW:
-            self._move_left()
-        elif key_pressed == py_cui.keys.KEY_RIGHT_ARROW:
-            self._move_right()
-        elif key_pressed == py_cui.keys.KEY_BACKSPACE:
-            self._erase_char()
-        elif key_pressed == py_cui.keys.KEY_DELETE:
-            self._delete_char()
-        elif key_pressed == py_cui.keys.KEY_HOME:
-            self._jump_to_start()
-        elif key_pressed == py_cui.keys.KEY_END:
-            self._jump_to_end()
-        elif key_pressed > 31 and key_pressed < 128 or \
-                key_pressed > 1000 and key_pressed < 1128:
+        # The visible text depends on the cursor once the text is wider than the box
+        old_state = (self._text, self._cursor_text_pos)
+        handler = self._KEY_HANDLERS.get(key_pressed)
+        if handler is not None:
+            getattr(self, handler)()
+        elif key_pressed in _PRINTABLE_KEYS:
             self._insert_char(key_pressed)
+        if (self._text, self._cursor_text_pos) != old_state:
+            self._dirty = True
 
 
     def _draw_content(self):
-      render_text = self._text
-      if len(self._text) > self._viewport_width:
-        end = len(self._text) - self._viewport_width
-        if self._cursor_text_pos < end:
-          render_text = self._text[self._cursor_text_pos:self._cursor_text_pos + self._viewport_width]
-        else:
-          render_text = self._text[end:]
-      if self._password:
-        temp = '*' * len(render_text)
-        render_text = temp
-      self._parent._renderer.draw_text_in_viewport(self, render_text, selected=self._focused)
+      text = self._text
+      width = self._viewport_width
+      key = (text, self._cursor_text_pos, width, self._password)
+      if self._render_cache is not None and self._render_cache[0] == key:
+        render_text = self._render_cache[1]
+      else:
+        render_text = text
+        end = len(text) - width
+        if end > 0:
+          # The view starts at the cursor, but never scrolls past the end of the text
+          start = min(self._cursor_text_pos, end)
+          render_text = text[start:start + width]
+        if self._password:
+          render_text = self._password_mask[:len(render_text)]
+        self._render_cache = (key, render_text)
+      self._renderer.draw_text_in_viewport(self, render_text, selected=self._focused)
 
 
     def _draw_cursor(self):
         if self._focused:
-            self._parent._renderer.draw_cursor(self._cursor_y, self._cursor_x)
+            self._renderer.draw_cursor(self._cursor_y, self._cursor_x)
         else:
-            self._parent._renderer.reset_cursor(self)
+            self._renderer.reset_cursor(self)
 
 
@@ -1,4 +1,4 @@
-import curses
+import types
 import py_cui
 import py_cui.ui
 import py_cui.colors
@@ -6,30 +6,40 @@ import py_cui.errors
 
 
 class Widget(py_cui.ui.UIElement):
+  # Read-only empties shared by widgets until a key command or color rule is added,
+  # and by the widgets that fire no events
+  _NO_EVENTS = types.MappingProxyType({})
+  _NO_KEY_COMMANDS = types.MappingProxyType({})
+  _NO_COLOR_RULES = ()
+
   def __init__(self, parent, title):
       super().__init__(parent.get_next_id(), title,
                        parent._renderer, parent._logger)
       self._parent = parent
 
-      self._events = {
-      }
+      self._events = Widget._NO_EVENTS
 
-      self._key_commands     = {}
-      self._text_color_rules = []
+      self._key_commands     = Widget._NO_KEY_COMMANDS
+      self._text_color_rules = Widget._NO_COLOR_RULES
       self._default_color = py_cui.WHITE_ON_BLACK
       self._border_color = self._default_color
 
 
   def add_key_command(self, key, command):
+      if self._key_commands is Widget._NO_KEY_COMMANDS:
+          self._key_commands = {}
       self._key_commands[key] = command
 
 
-  def add_text_color_rule(self, regex, color, rule_type, match_type='line', region=[0,1], include_whitespace=False, selected_color=None):
+  def add_text_color_rule(self, regex, color, rule_type, match_type='line', region=(0, 1), include_whitespace=False, selected_color=None):
+      self._dirty = True
       selected = color
       if selected_color is not None:
           selected = selected_color
 
       new_color_rule = py_cui.colors.ColorRule(regex, color, selected, rule_type, match_type, region, include_whitespace, self._logger)
+      if self._text_color_rules is Widget._NO_COLOR_RULES:
+          self._text_color_rules = []
       self._text_color_rules.append(new_color_rule)
 
 
@@ -42,9 +52,12 @@ class Widget(py_cui.ui.UIElement):
 
 
   def _handle_key_press(self, key_pressed):
-      if key_pressed in self._key_commands.keys():
-          command = self._key_commands[key_pressed]
+      # Widgets mark themselves dirty when a key changes their state. A user
+      # command may change anything, so redraw after running one.
+      command = self._key_commands.get(key_pressed)
+      if command is not None:
           command()
+          self._dirty = True
           return True
       return False
 
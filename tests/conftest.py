@@ -2,7 +2,6 @@ import pytest
 
 import py_cui
 import py_cui.debug as dbg
-import py_cui.grid
 
 
 
@@ -72,13 +71,10 @@ def SCROLLMENU(request, GRID, LOGGER):
 
 
 @pytest.fixture
-def CHECKBOXMENU(request, GRID, LOGGER):
+def CHECKBOXMENU(request, PYCUI):
 
-    test_grid = GRID(10, 10, 100, 100)
-    scroll = py_cui.widgets.CheckBoxMenu('1', 'Scroll', test_grid, 0, 0, 1, 1, 1, 0, LOGGER, 'X')
-    scroll.selected = True
-
-    return scroll
+    root = PYCUI(10, 10, 100, 100).get_root()
+    return root.add_widget(py_cui.widgets.CheckBoxMenu(root, 'Scroll', 'X'), 0, 0)
 
 
 @pytest.fixture
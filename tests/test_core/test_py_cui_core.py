@@ -127,3 +127,58 @@ def test_add_text_block(PYCUI):
     row, col = widget.get_grid_cell()
     assert row == 1
     assert col == 1
+
+
+class _RecordingScreen:
+    """Minimal curses screen stand-in that keeps what was on screen at each key wait"""
+
+    def __init__(self, height, width, keys):
+        self.rows = [[' '] * width for _ in range(height)]
+        self.keys = list(keys)
+        self.frames = []
+
+    def addstr(self, y, x, text):
+        for i, char in enumerate(text):
+            if 0 <= y < len(self.rows) and 0 <= x + i < len(self.rows[y]):
+                self.rows[y][x + i] = char
+
+    def getch(self):
+        self.frames.append([list(row) for row in self.rows])
+        key = self.keys.pop(0)
+        return key() if callable(key) else key
+
+    def erase(self):
+        for row in self.rows:
+            row[:] = ' ' * len(row)
+
+    clear = erase
+
+    def attron(self, *args):
+        pass
+
+    attroff = timeout = refresh = move = attron
+
+
+def test_set_border_characters_redraws_all_widgets(PYCUI, monkeypatch):
+    for name in ['start_color', 'init_color', 'init_pair', 'endwin', 'curs_set', 'mousemask']:
+        monkeypatch.setattr(py_cui.curses, name, lambda *args: None)
+    monkeypatch.setattr(py_cui.curses, 'color_pair', lambda color: 0)
+
+    test_cui = PYCUI(4, 5, 30, 100)
+    root = test_cui.get_root()
+    widgets = [root.add_widget(py_cui.widgets.ScrollMenu(root, 'Menu'), 0, 0),
+               root.add_widget(py_cui.widgets.Button(root, 'Button', None), 1, 1),
+               root.add_widget(py_cui.widgets.TextBox(root, 'Text'), 2, 2)]
+
+    def switch_borders():
+        test_cui.set_unicode_borders()
+        return 0
+
+    # The first frame uses the default borders, the second one follows the switch
+    screen = _RecordingScreen(30, 100, [switch_borders, py_cui.keys.KEY_Q_LOWER])
+    test_cui._draw(screen)
+    first, second = screen.frames
+    for widget in widgets:
+        x, y = widget.get_widget_start_pos()
+        assert first[y][x] == '+'
+        assert second[y][x] == '╭'
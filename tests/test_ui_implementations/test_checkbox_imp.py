@@ -14,8 +14,8 @@ def test_add_item_list(CHECKBOXMENU):
         counter = counter + 1
     assert scroll.get_selected_item_index() == 0
     assert scroll.get() == "Elem0"
-    for item in scroll._selected_item_dict.keys():
-        assert not scroll._selected_item_dict[item]
+    for item in scroll.get_item_list():
+        assert not scroll.is_checked(item)
     scroll.clear()
 
 
@@ -24,8 +24,39 @@ def test_mark_item(CHECKBOXMENU):
     scroll.add_item_list(elems)
     scroll.set_selected_item_index(1)
     assert scroll.get() == "Elem1"
-    print(scroll._selected_item_dict)
+    assert scroll._checked == set()
     scroll.mark_item_as_checked(scroll.get())
-    print(scroll._selected_item_dict)
-    assert scroll._selected_item_dict[scroll.get()]
+    assert scroll._checked == {"Elem1"}
+    scroll.clear()
+
+
+def test_set_selected_item_forgets_replaced_item(CHECKBOXMENU):
+    scroll = CHECKBOXMENU
+    scroll.add_item_list(elems)
+    scroll.set_selected_item_index(1)
+    scroll.mark_item_as_checked(scroll.get())
+    scroll.set_selected_item("New1")
+    assert scroll.get() == "New1"
+    assert not scroll.is_checked("New1")
+    assert "Elem1" not in scroll._checked
+    assert "Elem1" not in scroll._item_strs
+    assert scroll._item_strs["New1"] == "New1"
+    scroll.add_item("Elem1")
+    assert not scroll.is_checked("Elem1")
+    scroll.clear()
+
+
+def test_mark_item_toggles_and_ignores_empty_menu(CHECKBOXMENU):
+    scroll = CHECKBOXMENU
+    assert scroll.get() is None
+    scroll._handle_key_press(py_cui.keys.KEY_ENTER)
+    assert scroll._checked == set()
+    scroll.mark_item_as_checked(None)
+    assert scroll._checked == set()
+    scroll.add_item_list(elems)
+    scroll.mark_item_as_checked("Elem2")
+    assert scroll.is_checked("Elem2")
+    scroll.mark_item_as_checked("Elem2")
+    assert not scroll.is_checked("Elem2")
+    assert scroll._checked == set()
     scroll.clear()
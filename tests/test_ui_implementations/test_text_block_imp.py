@@ -266,3 +266,12 @@ def test_enter_inline(SCROLLTEXTBLOCK):
     assert text_box.get_current_line() == ' World'
     assert text_x == 0
     assert cursor_x == max_left
+
+
+def test_write_to_empty_block_sets_footer(PYCUI):
+    root = PYCUI(3, 3, 120, 120).get_root()
+    text_block = root.add_widget(py_cui.widgets.ScrollTextBlock(root, 'Test'), 0, 0)
+    assert text_block.get_footer() == ''
+    text_block.write('Hello World\nSecond Line')
+    assert text_block.get_footer() == '1:1'
+    assert text_block.get() == 'Hello World\nSecond Line\n'
@@ -0,0 +1,114 @@
+"""Replays a scripted key and mouse session against a fake curses screen.
+
+Development helper, run as a script only: it replaces curses functions as soon as it is loaded. Every
+refreshed frame, with a map of the attributes each cell was drawn with, is printed to stdout and the
+number of addstr calls to stderr, so drawing changes can be checked to keep the output identical while
+counting the work done:
+
+    python tools/replay_screen.py > before.txt
+    # apply the change
+    python tools/replay_screen.py > after.txt && cmp before.txt after.txt
+
+Set PKG to the root of another py_cui checkout to replay against it instead.
+"""
+
+import sys, os, curses
+ROOT = os.environ.get('PKG', os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+for name in ['start_color', 'init_color', 'init_pair', 'endwin']:
+    setattr(curses, name, lambda *a, **k: None)
+CURS = [None]
+def _curs_set(v): CURS[0] = v
+curses.curs_set = _curs_set
+curses.color_pair = lambda c: c << 8
+curses.mousemask = lambda *a: (0, 0)
+MOUSE = []
+def _getmouse():
+    x, y = MOUSE.pop(0)
+    return (0, x, y, 0, 0)
+curses.getmouse = _getmouse
+import py_cui
+import py_cui.keys as K
+
+H, W = 40, 120
+
+class FakeScr:
+    def __init__(self, script):
+        self.script = list(script)
+        self.rows = [[' '] * W for _ in range(H)]
+        self.attrs = [[0] * W for _ in range(H)]
+        self.attr = 0
+        self.cur = (0, 0)
+        self.frames = []
+        self.n_addstr = 0
+    def getmaxyx(self): return (H, W)
+    def erase(self):
+        self.rows = [[' '] * W for _ in range(H)]
+        self.attrs = [[0] * W for _ in range(H)]
+    clear = erase
+    def attron(self, a): self.attr |= a
+    def attroff(self, a): self.attr &= ~a
+    def timeout(self, t): pass
+    def move(self, y, x): self.cur = (y, x)
+    def addstr(self, y, x, s):
+        self.n_addstr += 1
+        for i, ch in enumerate(s):
+            if 0 <= y < H and 0 <= x + i < W:
+                self.rows[y][x + i] = ch
+                self.attrs[y][x + i] = self.attr
+        self.cur = (y, x + len(s))
+    def refresh(self):
+        sym = {}
+        amap = '\n'.join(''.join(sym.setdefault(a, chr(65 + len(sym))) for a in r) for r in self.attrs)
+        self.frames.append('\n'.join(''.join(r) for r in self.rows) + '\n' + amap + '\n' + repr(sorted(sym.items())) + '\nCURSOR %s %s' % (self.cur, CURS[0]))
+    def getch(self):
+        if not self.script:
+            return K.KEY_Q_LOWER
+        k = self.script.pop(0)
+        if isinstance(k, tuple):
+            MOUSE.append(k)
+            return curses.KEY_MOUSE
+        return k
+
+def build():
+    root = py_cui.PyCUI(4, 4, simulated_terminal=[H, W])
+    lay = root.get_root()
+    Wd = py_cui.widgets
+    ws = {}
+    ws['label'] = lay.add_widget(Wd.Label(lay, 'Hello\nWorld'), 0, 0)
+    ws['button'] = lay.add_widget(Wd.Button(lay, 'Btn', lambda: ws['label'].set_title('pressed')), 0, 1)
+    ws['menu'] = lay.add_widget(Wd.ScrollMenu(lay, 'Menu'), 1, 0, 2, 1)
+    ws['check'] = lay.add_widget(Wd.CheckBoxMenu(lay, 'Check', 'X'), 1, 1, 2, 1)
+    ws['text'] = lay.add_widget(Wd.TextBox(lay, 'Text'), 3, 0, 1, 2)
+    ws['block'] = lay.add_widget(Wd.ScrollTextBlock(lay, 'Block'), 1, 2, 2, 2)
+    ws['slider'] = lay.add_widget(Wd.Slider(lay, 'Slider', 0, 100, 5, 50), 0, 2, 1, 2)
+    ws['menu'].add_item_list(['item%d' % i for i in range(40)])
+    ws['check'].add_item_list(['c%d' % i for i in range(40)])
+    ws['block'].set_text('\n'.join('line %d ' % i * 3 for i in range(60)))
+    ws['text'].set_text('hello')
+    return root, lay, ws
+
+SCRIPT = [0, K.KEY_RIGHT_ARROW, K.KEY_ENTER, K.KEY_ESCAPE, K.KEY_DOWN_ARROW, K.KEY_ENTER, K.KEY_DOWN_ARROW, K.KEY_DOWN_ARROW,
+          K.KEY_PAGE_DOWN, K.KEY_END, K.KEY_ESCAPE, K.KEY_RIGHT_ARROW, K.KEY_ENTER,
+          K.KEY_DOWN_ARROW, K.KEY_ENTER, K.KEY_END, K.KEY_HOME, K.KEY_PAGE_DOWN, K.KEY_ENTER, K.KEY_ESCAPE, K.KEY_RIGHT_ARROW, K.KEY_ENTER,
+          K.KEY_DOWN_ARROW, K.KEY_END, K.KEY_TAB, ord('a'), ord('b'), K.KEY_BACKSPACE, K.KEY_ENTER,
+          K.KEY_PAGE_DOWN, K.KEY_PAGE_UP, K.KEY_UP_ARROW, K.KEY_DELETE, K.KEY_HOME, K.KEY_BACKSPACE, K.KEY_BACKSPACE,
+          K.KEY_PAGE_DOWN, K.KEY_PAGE_DOWN, K.KEY_PAGE_DOWN, K.KEY_PAGE_DOWN, K.KEY_DOWN_ARROW, K.KEY_DOWN_ARROW,
+          K.KEY_ENTER, K.KEY_ENTER, K.KEY_LEFT_ARROW, K.KEY_RIGHT_ARROW] + [ord('z')] * 50 + [K.KEY_HOME, K.KEY_END, K.KEY_ESCAPE,
+          K.KEY_UP_ARROW, K.KEY_ENTER, K.KEY_RIGHT_ARROW, K.KEY_RIGHT_ARROW, K.KEY_LEFT_ARROW, K.KEY_ESCAPE,
+          K.KEY_LEFT_ARROW, K.KEY_DOWN_ARROW, K.KEY_DOWN_ARROW, K.KEY_ENTER, ord('x'), K.KEY_HOME, ord('y'), K.KEY_END, K.KEY_BACKSPACE,
+          K.KEY_LEFT_ARROW, K.KEY_DELETE] + [ord('w')] * 70 + [K.KEY_HOME, K.KEY_RIGHT_ARROW, K.KEY_END, K.KEY_ESCAPE,
+          K.KEY_UP_ARROW, K.KEY_UP_ARROW, K.KEY_LEFT_ARROW, K.KEY_UP_ARROW,
+          (5, 12), (6, 14), (40, 15), (42, 18), (70, 20), (75, 22), (10, 35), (15, 35), (40, 5), (70, 5), (35, 4),
+          K.KEY_ESCAPE, K.KEY_UP_ARROW, K.KEY_UP_ARROW, K.KEY_ENTER, K.KEY_ESCAPE, K.KEY_Q_LOWER]
+
+if __name__ == '__main__':
+    root, lay, ws = build()
+    scr = FakeScr(SCRIPT)
+    root._draw(scr)
+    out = sys.stdout
+    for i, f in enumerate(scr.frames):
+        out.write('=== frame %d\n%s\n' % (i, f))
+    out.write('STATE %r\n' % ((ws['text'].get(), ws['slider'].get_slider_value(), ws['menu'].get(), ws['check'].get(),
+                               ws['block']._text_lines[:6], ws['block'].get_cursor_text_pos()),))
+    sys.stderr.write('addstr calls %d\n' % scr.n_addstr)